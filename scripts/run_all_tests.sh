@@ -3,8 +3,20 @@
 set -e
 cd "$(dirname "$0")/.."
 if [[ ! -d venv ]]; then
-  echo "Create venv first: python -m venv venv && ./venv/bin/pip install pytest"
+  echo "Create venv first: python -m venv venv && ./venv/bin/pip install pytest pytest-xdist"
   exit 1
 fi
 export PYTHONPATH="$PWD"
-./venv/bin/pytest src/tests/ -v --tb=short "$@"
+# Parallel run when pytest-xdist is installed. loadfile keeps each test file on one worker,
+# so module/session fixtures (shared services, TestClient, yfinance stub) are built once per file.
+XDIST_ARGS=()
+if ./venv/bin/python -c "import xdist" 2>/dev/null; then
+  XDIST_ARGS=(-n auto --dist=loadfile)
+fi
+# FAST=1 for tight local loops: no .pytest_cache writes, no .pyc files, and tests marked slow are skipped.
+FAST_ARGS=()
+if [[ "${FAST:-0}" == "1" ]]; then
+  export PYTHONDONTWRITEBYTECODE=1 PYTEST_FAST=1
+  FAST_ARGS=(-p no:cacheprovider)
+fi
+./venv/bin/pytest src/tests/ -v --tb=short "${XDIST_ARGS[@]}" "${FAST_ARGS[@]}" "$@"
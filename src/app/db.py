@@ -2,7 +2,7 @@
 from pathlib import Path
 import sqlite3
 
-from src.service.util import _load_config
+from src.service.util import _load_config, connect_db
 
 
 def _create_accounts_schema(conn: sqlite3.Connection) -> None:
@@ -73,21 +73,22 @@ def init_database() -> None:
     prices_path = config.get("HistoricalPricesDBPath", "./data/historical_prices.sqlite")
 
     for path_str in (account_path, txn_path, prices_path):
-        Path(path_str).parent.mkdir(parents=True, exist_ok=True)
+        if not path_str.startswith("file:"):
+            Path(path_str).parent.mkdir(parents=True, exist_ok=True)
 
-    conn_acc = sqlite3.connect(account_path)
+    conn_acc = connect_db(account_path)
     try:
         _create_accounts_schema(conn_acc)
     finally:
         conn_acc.close()
 
-    conn_txn = sqlite3.connect(txn_path)
+    conn_txn = connect_db(txn_path)
     try:
         _create_transactions_schema(conn_txn)
     finally:
         conn_txn.close()
 
-    conn_prices = sqlite3.connect(prices_path)
+    conn_prices = connect_db(prices_path)
     try:
         _create_historical_prices_schema(conn_prices)
     finally:
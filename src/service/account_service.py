@@ -1,9 +1,8 @@
 from dataclasses import dataclass
 from typing import List, Optional
-import sqlite3
 
 from src.utils.exceptions import ValidationError, NotFoundError
-from src.service.util import _load_config
+from src.service.util import _load_config, connect_db
 
 
 @dataclass
@@ -23,7 +22,7 @@ class AccountService:
         if not data.name:
             raise ValidationError("Account name is required")
 
-        conn = sqlite3.connect(self._account_db_path)
+        conn = connect_db(self._account_db_path)
         try:
             cur = conn.cursor()
             cur.execute("SELECT 1 FROM accounts WHERE name = ?", (data.name,))
@@ -42,16 +41,25 @@ class AccountService:
             self.save_account(account)
 
     def save_account(self, account: AccountCreate):
-        conn = sqlite3.connect(self._account_db_path)
+        conn = connect_db(self._account_db_path)
         try:
             conn.execute("INSERT INTO accounts (name) VALUES (?)", (account.name,))
             conn.commit()
         finally:
             conn.close()
 
+    def save_accounts_bulk(self, accounts: List[AccountCreate]):
+        """Insert several accounts with one executemany and a single commit (no validation, like save_account)."""
+        conn = connect_db(self._account_db_path)
+        try:
+            conn.executemany("INSERT INTO accounts (name) VALUES (?)", [(a.name,) for a in accounts])
+            conn.commit()
+        finally:
+            conn.close()
+
     def list_accounts(self):
         """Return all accounts as small dicts (e.g. for filter dropdown and add/edit account field)."""
-        conn = sqlite3.connect(self._account_db_path)
+        conn = connect_db(self._account_db_path)
         try:
             cur = conn.cursor()
             cur.execute("SELECT name FROM accounts ORDER BY name")
@@ -60,7 +68,7 @@ class AccountService:
             conn.close()
 
     def get_account(self, account_name: str):
-        conn = sqlite3.connect(self._account_db_path)
+        conn = connect_db(self._account_db_path)
         try:
             cur = conn.cursor()
             cur.execute("SELECT * FROM accounts WHERE name = ?", (account_name,))
@@ -77,7 +85,7 @@ class AccountService:
         if not new_data.name:
             raise ValidationError("New account name is required")
 
-        conn = sqlite3.connect(self._account_db_path)
+        conn = connect_db(self._account_db_path)
         try:
             cur = conn.cursor()
             # Check duplicate only if name is changing
@@ -95,7 +103,7 @@ class AccountService:
         return self.get_account(new_data.name)
 
     def delete_account(self, account_name: str):
-        conn = sqlite3.connect(self._account_db_path)
+        conn = connect_db(self._account_db_path)
         try:
             conn.execute("DELETE FROM accounts WHERE name = ?", (account_name,))
             conn.commit()
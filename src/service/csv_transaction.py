@@ -14,6 +14,7 @@ import io
 import uuid
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from src.service.enums import TransactionType
@@ -281,8 +282,10 @@ def transactions_to_csv(rows: List[dict]) -> str:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
 def generate_template_csv() -> str:
-    """Return a CSV string with the header and example rows for each txn_type."""
+    """Return a CSV string with the header and example rows for each txn_type.
+    The template only depends on module constants, so it is built once and cached."""
     output = io.StringIO()
     writer = csv.DictWriter(output, fieldnames=CSV_COLUMNS, extrasaction="ignore")
     writer.writeheader()
@@ -8,9 +8,7 @@ V1 uses Close (unadjusted) for market value; price_type = 'close'.
 from datetime import datetime, date, timedelta, timezone
 from typing import Optional
 
-import sqlite3
-
-from src.service.util import _load_config, round2
+from src.service.util import _load_config, connect_db, round2
 
 
 def _get_yf():
@@ -114,7 +112,7 @@ class HistoricalPriceService:
         overwrite: bool = False,
     ) -> dict[str, dict[str, float]]:
         """Load cached close_price by (symbol, date). Returns {symbol: {date_str: close}}."""
-        conn = sqlite3.connect(self._db_path)
+        conn = connect_db(self._db_path)
         out = {s: {} for s in symbols}
         try:
             cur = conn.cursor()
@@ -275,7 +273,7 @@ class HistoricalPriceService:
     ) -> None:
         """Merge fetched into cache and write to DB."""
         now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        conn = sqlite3.connect(self._db_path)
+        conn = connect_db(self._db_path)
         try:
             for sym, by_date in fetched.items():
                 for date_s, close in by_date.items():
@@ -17,6 +17,9 @@ if TYPE_CHECKING:
     from src.service.quote_service import QuoteService
 
 
+_ZERO = Decimal("0")
+
+
 def _round_quantity(value: float) -> float:
     """Round quantity to 4 decimal places (fractional shares)."""
     return round(float(value), 4)
@@ -52,12 +55,12 @@ class PortfolioService:
         # Same semantics as list_transactions: None or empty list => all accounts
         rows = self._txn_svc.list_transactions(account_names=account_names)
 
-        cash = Decimal("0")
+        cash = _ZERO
         # Per-account cash (for account_cash in response)
         by_account: dict[str, Decimal] = defaultdict(Decimal)
         # Per-symbol: quantity_held, total_buy_cost, total_buy_qty (for avg cost)
         by_symbol: dict[str, dict] = defaultdict(
-            lambda: {"quantity": Decimal("0"), "total_buy_cost": Decimal("0"), "total_buy_qty": Decimal("0")}
+            lambda: {"quantity": _ZERO, "total_buy_cost": _ZERO, "total_buy_qty": _ZERO}
         )
 
         for row in rows:
@@ -90,15 +93,16 @@ class PortfolioService:
                 if qty is not None and price is not None:
                     amount = Decimal(str(qty)) * Decimal(str(price))
                 else:
-                    amount = Decimal("0")
+                    amount = _ZERO
                 debit = amount + fees
                 cash -= debit
                 by_account[acc_name] -= debit
                 sym = normalize_symbol(row.get("symbol"))
                 if sym:
-                    by_symbol[sym]["quantity"] += Decimal(str(qty or 0))
-                    by_symbol[sym]["total_buy_cost"] += amount + fees
-                    by_symbol[sym]["total_buy_qty"] += Decimal(str(qty or 0))
+                    qty_d = Decimal(str(qty or 0))
+                    by_symbol[sym]["quantity"] += qty_d
+                    by_symbol[sym]["total_buy_cost"] += debit
+                    by_symbol[sym]["total_buy_qty"] += qty_d
 
             elif txn_type == TransactionType.SELL:
                 qty = row.get("quantity")
@@ -106,7 +110,7 @@ class PortfolioService:
                 if qty is not None and price is not None:
                     amount = Decimal(str(qty)) * Decimal(str(price))
                 else:
-                    amount = Decimal("0")
+                    amount = _ZERO
                 credit = amount - fees
                 cash += credit
                 cash_dest = row.get("cash_destination_account") or acc_name
@@ -155,55 +159,33 @@ class PortfolioService:
         """
         Return the quantity of symbol held in the given account (from transactions).
         Returns Decimal(0) if the account has no position in that symbol.
+        Summed in SQL over that account's rows in that symbol only (this runs on every SELL check).
         """
-        summary = self.get_summary(account_names=[account_name], include_quotes=False)
         norm = normalize_symbol(symbol)
         if not norm:
             return Decimal("0")
-        for pos in summary["positions"]:
-            if pos["symbol"] == norm:
-                return Decimal(str(pos["quantity"]))
-        return Decimal("0")
+        held = self._txn_svc.net_quantities_by_account(norm, account_names=[account_name])
+        quantity = _round_quantity(held.get(account_name, 0.0))
+        if quantity <= 0:
+            return Decimal("0")
+        return Decimal(str(quantity))
 
     def get_positions_by_symbol(self, symbol: str) -> list[dict]:
         """
         Return per-account quantities for the given symbol (only accounts with quantity > 0),
         sorted by quantity descending. Each item: {"account_name": str, "quantity": float}.
 
-        Computed in a single pass over all transactions (O(N) where N = total transactions).
+        The per-account BUY - SELL sums come from one SQL GROUP BY over that symbol's transactions.
         """
         norm = normalize_symbol(symbol)
         if not norm:
             return []
 
-        rows = self._txn_svc.list_transactions(account_names=None)
-        by_account: dict[str, Decimal] = defaultdict(Decimal)
-
-        for row in rows:
-            row_sym = normalize_symbol(row.get("symbol"))
-            if row_sym != norm:
-                continue
-            acc_name = row.get("account_name") or ""
-            if not acc_name:
-                continue
-            txn_type_str = row.get("txn_type")
-            try:
-                txn_type = TransactionType(txn_type_str)
-            except (ValueError, TypeError):
-                continue
-            qty = row.get("quantity")
-            if qty is None:
-                continue
-            if txn_type == TransactionType.BUY:
-                by_account[acc_name] += Decimal(str(qty))
-            elif txn_type == TransactionType.SELL:
-                by_account[acc_name] -= Decimal(str(qty))
-
-        result = [
-            {"account_name": acc, "quantity": _round_quantity(float(qty))}
-            for acc, qty in by_account.items()
-            if qty > 0
-        ]
+        result = []
+        for acc, qty in self._txn_svc.net_quantities_by_account(norm).items():
+            quantity = _round_quantity(qty)
+            if acc and quantity > 0:
+                result.append({"account_name": acc, "quantity": quantity})
         result.sort(key=lambda x: -x["quantity"])
         return result
 
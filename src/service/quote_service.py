@@ -5,7 +5,7 @@ In-memory cache with TTL; degrades gracefully on timeout or per-symbol failure.
 
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from typing import Optional
+from typing import Callable, Optional
 
 from src.service.util import round2
 
@@ -18,6 +18,8 @@ def _get_yf():
 DEFAULT_TTL_SECONDS = 120
 # Longer timeout for packaged app where first yfinance call can be slow (SSL, DNS, cold start).
 DEFAULT_FETCH_TIMEOUT_SECONDS = 25
+# Pause before the single retry when a fetch returns no prices.
+DEFAULT_RETRY_DELAY_SECONDS = 1.0
 
 
 def _safe_quote_for_symbol(symbol: str, tickers_obj) -> tuple[Optional[float], str, Optional[float]]:
@@ -78,12 +80,22 @@ class QuoteService:
         self,
         ttl_seconds: float = DEFAULT_TTL_SECONDS,
         fetch_timeout_seconds: float = DEFAULT_FETCH_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        retry_delay_seconds: float = DEFAULT_RETRY_DELAY_SECONDS,
     ):
         self._ttl = ttl_seconds
         self._fetch_timeout = fetch_timeout_seconds
+        self._retry_delay = retry_delay_seconds
+        # Time source for cache timestamps (injectable so tests can advance time without sleeping)
+        self._now = clock
         # Cache: symbol -> (current_price, display_name, previous_close, cached_at)
         self._cache: dict[str, tuple[Optional[float], str, Optional[float], float]] = {}
 
+    def _expire_all(self) -> None:
+        """Mark every cached quote as stale so the next get_quotes refetches it (keeps cached values)."""
+        for sym, (price, name, prev_close, _cached_at) in self._cache.items():
+            self._cache[sym] = (price, name, prev_close, float("-inf"))
+
     def _fetch_with_retry(self, to_fetch: list[str]) -> dict[str, dict]:
         """Fetch quotes with timeout; retry once if all results are empty (e.g. slow first call in packaged app)."""
         for attempt in range(2):
@@ -98,8 +110,8 @@ class QuoteService:
             # If we got at least one valid price, use it; else retry once.
             if any((fetched.get(s) or {}).get("current_price") is not None for s in to_fetch):
                 return fetched
-            if attempt == 0:
-                time.sleep(1)  # Brief pause before retry
+            if attempt == 0 and self._retry_delay > 0:
+                time.sleep(self._retry_delay)  # Brief pause before retry
         return fetched
 
     def get_quotes(self, symbols: list[str]) -> dict[str, dict]:
@@ -110,7 +122,7 @@ class QuoteService:
         """
         if not symbols:
             return {}
-        now = time.monotonic()
+        now = self._now()
         result = {}
         to_fetch = []
         for sym in symbols:
@@ -132,6 +144,6 @@ class QuoteService:
                 name = data.get("display_name") or sym
                 prev_close = data.get("previous_close")
                 result[sym] = {"current_price": price, "display_name": name, "previous_close": prev_close}
-                self._cache[sym] = (price, name, prev_close, time.monotonic())
+                self._cache[sym] = (price, name, prev_close, self._now())
 
         return result
@@ -9,7 +9,7 @@ import uuid
 
 from src.service.enums import TransactionType
 from src.utils.exceptions import ValidationError, NotFoundError
-from src.service.util import _load_config, normalize_symbol
+from src.service.util import _load_config, connect_db, normalize_symbol
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,11 @@ INSERT INTO transactions (
 """
 
 
+def _in_placeholders(n: int) -> str:
+    """Placeholder list ("?,?,...") for an IN filter over n values."""
+    return ",".join("?" * n)
+
+
 @dataclass
 class TransactionCreate:
     account_name: str
@@ -79,7 +84,14 @@ class TransactionService:
         self._quote_service = quote_service
         self._get_quantity_held = get_quantity_held
 
-    def _validate_transaction_create(self, data: TransactionCreate) -> None:
+    def _validate_transaction_create(
+        self,
+        data: TransactionCreate,
+        pending_quantities: Optional[dict[tuple[str, str], Decimal]] = None,
+    ) -> None:
+        """Raise ValidationError/NotFoundError if data cannot be saved.
+        pending_quantities: (account_name, symbol) -> net shares from not-yet-saved transactions
+        earlier in the same batch, added to the held quantity for SELL checks."""
         if data.txn_time_est is None:
             raise ValidationError("txn_time_est is required")
         self._validate_account(data.account_name)
@@ -111,6 +123,8 @@ class TransactionService:
                 raise ValidationError("Fees cannot be negative")
             if data.txn_type == TransactionType.SELL and self._get_quantity_held and norm_symbol:
                 held = self._get_quantity_held(data.account_name, norm_symbol)
+                if pending_quantities:
+                    held += pending_quantities.get((data.account_name, norm_symbol), Decimal("0"))
                 if held <= 0:
                     raise ValidationError(
                         f"You do not hold {norm_symbol} in account {data.account_name}"
@@ -125,7 +139,7 @@ class TransactionService:
                 raise ValidationError(f"{data.txn_type.value} requires cash_amount > 0")
 
     def _validate_account(self, account_name: str):
-        conn = sqlite3.connect(self._account_db_path)
+        conn = connect_db(self._account_db_path)
         try:
             cur = conn.cursor()
             cur.execute("SELECT 1 FROM accounts WHERE name = ?", (account_name,))
@@ -139,9 +153,25 @@ class TransactionService:
         self._save_transaction(transaction)
 
     def create_batch_transaction(self, transactions: List[TransactionCreate]):
+        """Validate every transaction, then insert them all in one commit (nothing is saved if any fails)."""
+        if not transactions:
+            return
+        pending: dict[tuple[str, str], Decimal] = {}
+        rows = []
         for transaction in transactions:
-            self._validate_transaction_create(transaction)
-            self._save_transaction(transaction)
+            self._validate_transaction_create(transaction, pending)
+            rows.append(self._build_insert_params(transaction))
+            # Later SELLs in the batch may sell shares bought earlier in it
+            if transaction.txn_type in (TransactionType.BUY, TransactionType.SELL):
+                key = (transaction.account_name, normalize_symbol(transaction.symbol))
+                delta = transaction.quantity if transaction.txn_type == TransactionType.BUY else -transaction.quantity
+                pending[key] = pending.get(key, Decimal("0")) + delta
+        conn = connect_db(self._transaction_db_path)
+        try:
+            with conn:
+                conn.executemany(_INSERT_SQL, rows)
+        finally:
+            conn.close()
 
     def _build_insert_params(self, transaction: TransactionCreate) -> tuple:
         """Build the parameter tuple for the INSERT statement."""
@@ -166,7 +196,7 @@ class TransactionService:
 
     def _save_transaction(self, transaction: TransactionCreate):
         params = self._build_insert_params(transaction)
-        conn = sqlite3.connect(self._transaction_db_path)
+        conn = connect_db(self._transaction_db_path)
         try:
             conn.execute(_INSERT_SQL, params)
             conn.commit()
@@ -184,13 +214,13 @@ class TransactionService:
         If account_names is set (non-empty list), only from those accounts; otherwise all accounts.
         If limit/offset are provided, apply SQL LIMIT/OFFSET for efficient pagination.
         """
-        conn = sqlite3.connect(self._transaction_db_path)
+        conn = connect_db(self._transaction_db_path)
         try:
             conn.row_factory = sqlite3.Row
             cur = conn.cursor()
             params: list = []
             if account_names:
-                placeholders = ",".join("?" * len(account_names))
+                placeholders = _in_placeholders(len(account_names))
                 sql = f"SELECT * FROM transactions WHERE account_name IN ({placeholders}) ORDER BY txn_time_est DESC"
                 params = list(account_names)
             else:
@@ -202,12 +232,38 @@ class TransactionService:
                     sql += " OFFSET ?"
                     params.append(offset)
             cur.execute(sql, params)
-            return [dict(row) for row in cur.fetchall()]
+            return [dict(row) for row in cur]
+        finally:
+            conn.close()
+
+    def net_quantities_by_account(
+        self, symbol: str, account_names: Optional[List[str]] = None
+    ) -> dict[str, float]:
+        """Return {account_name: BUY quantity - SELL quantity} for symbol.
+
+        The fold runs in SQLite (one GROUP BY) rather than row by row in Python. Stored symbols are
+        already normalized on insert, so the argument is normalized and compared as-is.
+        If account_names is set (non-empty list), only those accounts are included.
+        """
+        sql = (
+            "SELECT account_name, SUM(CASE txn_type WHEN ? THEN quantity WHEN ? THEN -quantity END) "
+            "FROM transactions WHERE symbol = ?"
+        )
+        params: list = [TransactionType.BUY.value, TransactionType.SELL.value, normalize_symbol(symbol)]
+        if account_names:
+            sql += f" AND account_name IN ({_in_placeholders(len(account_names))})"
+            params.extend(account_names)
+        sql += " GROUP BY account_name"
+        conn = connect_db(self._transaction_db_path)
+        try:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            return {name: qty or 0.0 for name, qty in cur}
         finally:
             conn.close()
 
     def get_transaction(self, transaction_id: str) -> dict:
-        conn = sqlite3.connect(self._transaction_db_path)
+        conn = connect_db(self._transaction_db_path)
         try:
             conn.row_factory = sqlite3.Row
             cur = conn.cursor()
@@ -272,7 +328,7 @@ class TransactionService:
             txn_create.cash_destination_account = data.cash_destination_account
 
         # 3. Delete old, then create new; restore original on failure
-        conn = sqlite3.connect(self._transaction_db_path)
+        conn = connect_db(self._transaction_db_path)
         try:
             conn.execute("DELETE FROM transactions WHERE txn_id = ?", (data.txn_id,))
             conn.commit()
@@ -289,7 +345,7 @@ class TransactionService:
         return self.get_transaction(data.txn_id)
 
     def delete_transaction(self, transaction_id: str):
-        conn = sqlite3.connect(self._transaction_db_path)
+        conn = connect_db(self._transaction_db_path)
         try:
             conn.execute("DELETE FROM transactions WHERE txn_id = ?", (transaction_id,))
             conn.commit()
@@ -298,7 +354,7 @@ class TransactionService:
 
     def update_account_name_in_transactions(self, old_name: str, new_name: str) -> None:
         """Update account_name for all transactions when an account is renamed."""
-        conn = sqlite3.connect(self._transaction_db_path)
+        conn = connect_db(self._transaction_db_path)
         try:
             conn.execute(
                 "UPDATE transactions SET account_name = ? WHERE account_name = ?",
@@ -310,11 +366,11 @@ class TransactionService:
 
     def count_transactions(self, account_names: Optional[List[str]] = None) -> int:
         """Return total count of transactions, optionally filtered by account name(s)."""
-        conn = sqlite3.connect(self._transaction_db_path)
+        conn = connect_db(self._transaction_db_path)
         try:
             cur = conn.cursor()
             if account_names:
-                placeholders = ",".join("?" * len(account_names))
+                placeholders = _in_placeholders(len(account_names))
                 cur.execute(
                     f"SELECT COUNT(*) FROM transactions WHERE account_name IN ({placeholders})",
                     account_names,
@@ -327,7 +383,7 @@ class TransactionService:
 
     def count_transactions_by_account(self) -> dict[str, int]:
         """Return {account_name: count} for all accounts that have transactions."""
-        conn = sqlite3.connect(self._transaction_db_path)
+        conn = connect_db(self._transaction_db_path)
         try:
             cur = conn.cursor()
             cur.execute(
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Optional
 import json
 import os
+import sqlite3
 
 
 def get_data_dir() -> str:
@@ -38,6 +39,11 @@ def _load_config() -> dict:
     return config
 
 
+def connect_db(db_path: str, **kwargs) -> sqlite3.Connection:
+    """Open a SQLite connection; "file:" paths are opened as URIs (e.g. shared-cache in-memory test DBs)."""
+    return sqlite3.connect(db_path, uri=db_path.startswith("file:"), **kwargs)
+
+
 def normalize_symbol(s: Optional[str]) -> Optional[str]:
     """Normalize symbol: strip whitespace and uppercase; None or empty -> None."""
     if s is None:
@@ -1,11 +1,17 @@
 """
 Pytest fixtures for service tests.
-Provides isolated test DBs under src/tests/.test_cache and schema creation.
+Provides isolated in-memory test DBs (see memory_db) and schema creation.
 """
-from pathlib import Path
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional, Union
+from unittest.mock import MagicMock
+import os
 import sqlite3
-import tempfile
-import shutil
+import sys
+import types
+import uuid
+from types import MappingProxyType, SimpleNamespace as NS
 
 import pytest
 
@@ -16,104 +22,206 @@ from src.service.transaction_service import (
     TransactionEdit,
 )
 from src.service.enums import TransactionType
+from src.service.util import connect_db
 from src.utils.exceptions import NotFoundError
 
 
-# Test cache directory under src/tests
-TESTS_DIR = Path(__file__).resolve().parent
-TEST_CACHE = TESTS_DIR / ".test_cache"
+# Test schema as DDL scripts: each schema is applied with a single executescript call.
+_ACCOUNTS_DDL = """
+CREATE TABLE IF NOT EXISTS accounts (
+    name TEXT NOT NULL PRIMARY KEY
+);
+"""
 
+_TRANSACTIONS_DDL = """
+CREATE TABLE IF NOT EXISTS transactions (
+    txn_id TEXT NOT NULL PRIMARY KEY,
+    account_name TEXT NOT NULL,
+    txn_type TEXT NOT NULL,
+    txn_time_est TEXT NOT NULL,
+    symbol TEXT,
+    quantity REAL,
+    price REAL,
+    cash_amount REAL,
+    fees REAL,
+    note TEXT,
+    cash_destination_account TEXT
+);
+"""
 
-def _ensure_test_cache():
-    TEST_CACHE.mkdir(parents=True, exist_ok=True)
-    return TEST_CACHE
+_HISTORICAL_PRICES_DDL = """
+CREATE TABLE IF NOT EXISTS historical_prices (
+    symbol TEXT NOT NULL,
+    date TEXT NOT NULL,
+    close_price REAL NOT NULL,
+    adj_close_price REAL,
+    price_type TEXT NOT NULL DEFAULT 'close',
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (symbol, date)
+);
+CREATE INDEX IF NOT EXISTS idx_historical_prices_symbol_date ON historical_prices(symbol, date);
+"""
 
 
 def _create_accounts_schema(conn: sqlite3.Connection) -> None:
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS accounts (
-            name TEXT NOT NULL PRIMARY KEY
-        )
-        """
-    )
-    conn.commit()
+    conn.executescript(_ACCOUNTS_DDL)
 
 
 def _create_transactions_schema(conn: sqlite3.Connection) -> None:
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS transactions (
-            txn_id TEXT NOT NULL PRIMARY KEY,
-            account_name TEXT NOT NULL,
-            txn_type TEXT NOT NULL,
-            txn_time_est TEXT NOT NULL,
-            symbol TEXT,
-            quantity REAL,
-            price REAL,
-            cash_amount REAL,
-            fees REAL,
-            note TEXT,
-            cash_destination_account TEXT
-        )
-        """
-    )
-    conn.commit()
+    conn.executescript(_TRANSACTIONS_DDL)
 
 
 def _create_historical_prices_schema(conn: sqlite3.Connection) -> None:
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS historical_prices (
-            symbol TEXT NOT NULL,
-            date TEXT NOT NULL,
-            close_price REAL NOT NULL,
-            adj_close_price REAL,
-            price_type TEXT NOT NULL DEFAULT 'close',
-            updated_at TEXT NOT NULL,
-            PRIMARY KEY (symbol, date)
-        )
-        """
-    )
-    conn.execute(
-        "CREATE INDEX IF NOT EXISTS idx_historical_prices_symbol_date ON historical_prices(symbol, date)"
-    )
-    conn.commit()
+    conn.executescript(_HISTORICAL_PRICES_DDL)
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: multi-second tests; skipped when PYTEST_FAST=1")
+
+
+def pytest_collection_modifyitems(config, items):
+    """With PYTEST_FAST=1 (set by FAST=1 ./scripts/run_all_tests.sh), skip tests marked slow."""
+    if not os.environ.get("PYTEST_FAST"):
+        return
+    skip = pytest.mark.skip(reason="PYTEST_FAST=1")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_yfinance():
+    """Install a stand-in yfinance module for the session so nothing imports the real one (or hits the network).
+    Tests that need specific data still patch the services' _get_yf."""
+    fake = types.ModuleType("yfinance")
+    fake.Tickers = MagicMock(name="yfinance.Tickers")
+    fake.Ticker = MagicMock(name="yfinance.Ticker")
+    fake.download = MagicMock(name="yfinance.download")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "yfinance", fake)
+        yield fake
+
+
+@pytest.fixture(scope="session")
+def _app_config():
+    """Config of the app under test: every DB path is a shared-cache in-memory URI (see memory_db),
+    so API tests never touch ./data or the disk. The DBs live until the end of the session."""
+    from src.service.util import _load_config
+
+    dbs = [
+        ("AccountDBPath", memory_db("app_accounts", _create_accounts_schema)),
+        ("TransactionDBPath", memory_db("app_transactions", _create_transactions_schema)),
+        ("HistoricalPricesDBPath", memory_db("app_historical_prices", _create_historical_prices_schema)),
+    ]
+    _load_config.cache_clear()
+    config = _load_config()
+    for key, db in dbs:
+        config[key] = next(db)
+    try:
+        yield config
+    finally:
+        _load_config.cache_clear()
+        for _, db in dbs:
+            db.close()
 
 
-@pytest.fixture
-def test_cache_dir():
-    """Ensure test cache dir exists; yield path; optionally clean single-run DBs."""
-    path = _ensure_test_cache()
-    yield path
+# Quotes served to the app under test: a fixed in-memory table instead of yfinance.
+_APP_QUOTES = MappingProxyType({
+    "AAPL": MappingProxyType({"current_price": 200.0, "display_name": "Apple Inc.", "previous_close": 198.0}),
+    "MSFT": MappingProxyType({"current_price": 400.0, "display_name": "Microsoft Corporation", "previous_close": 398.5}),
+})
+
+
+class _AppQuoteService:
+    """QuoteService stand-in for the app: one dict lookup per symbol; unknown symbols come back unpriced."""
+
+    def get_quotes(self, symbols):
+        return {
+            s: _APP_QUOTES.get(s) or {"current_price": None, "display_name": s, "previous_close": None}
+            for s in symbols
+        }
+
+
+@pytest.fixture(scope="session")
+def app(_app_config):
+    """The FastAPI app, imported once per test session, with the routers' quote services replaced
+    for the session by _AppQuoteService (no yfinance fetch, timeout or retry pause)."""
+    from src.app.main import app as fastapi_app
+    from src.app.api.routers import portfolio, transactions
+
+    quotes = _AppQuoteService()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(portfolio, "_quote_service", quotes)
+        mp.setattr(transactions, "_quote_svc", quotes)
+        yield fastapi_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """One TestClient for the whole session; the context manager runs app startup (schema init) once."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as c:
+        yield c
+
+
+def clear_app_db(config):
+    """Empty the session app's accounts and transactions tables (config is the _app_config dict)."""
+    for path, table in ((config["TransactionDBPath"], "transactions"), (config["AccountDBPath"], "accounts")):
+        conn = connect_db(path)
+        try:
+            conn.execute(f"DELETE FROM {table}")
+            conn.commit()
+        finally:
+            conn.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_app_db(request):
+    """Before each test that uses the session client, empty the app's accounts and transactions tables.
+    Deleting rows is far cheaper than rebuilding the app or its DBs."""
+    if "client" not in request.fixturenames:
+        return
+    request.getfixturevalue("client")
+    clear_app_db(request.getfixturevalue("_app_config"))
 
 
 @pytest.fixture
-def temp_db_dir(test_cache_dir):
-    """Unique temp subdir under test cache for one test run (isolation)."""
-    d = tempfile.mkdtemp(prefix="db_", dir=test_cache_dir)
-    yield Path(d)
-    shutil.rmtree(d, ignore_errors=True)
+def seed_app(client):
+    """Seed the session app's DBs through its own services, bypassing HTTP routing (setup only):
+    seed_app(accounts=[names], transactions=[TransactionCreate]) saves each group in one batch."""
+    from src.app.api.routers import transactions as txn_router
+
+    def _seed(accounts=(), transactions=()):
+        if accounts:
+            txn_router._get_account_service().save_accounts_bulk([AccountCreate(name=n) for n in accounts])
+        if transactions:
+            txn_router._get_transaction_service().create_batch_transaction(list(transactions))
+    return _seed
+
+
+def memory_db(name: str, create_schema):
+    """Yield a shared-cache in-memory SQLite URI with schema (open it with connect_db).
+    A keep-alive connection holds the DB open until the generator is closed; no disk I/O."""
+    uri = f"file:{name}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keep_alive = connect_db(uri)
+    try:
+        create_schema(keep_alive)
+        yield uri
+    finally:
+        keep_alive.close()
 
 
 @pytest.fixture
-def account_db_path(temp_db_dir):
-    """Path to a fresh accounts DB with schema."""
-    path = temp_db_dir / "accounts.sqlite"
-    conn = sqlite3.connect(str(path))
-    _create_accounts_schema(conn)
-    conn.close()
-    return str(path)
+def account_db_path():
+    """URI of a fresh in-memory accounts DB with schema."""
+    yield from memory_db("accounts", _create_accounts_schema)
 
 
 @pytest.fixture
-def transaction_db_path(temp_db_dir):
-    """Path to a fresh transactions DB with schema."""
-    path = temp_db_dir / "transactions.sqlite"
-    conn = sqlite3.connect(str(path))
-    _create_transactions_schema(conn)
-    conn.close()
-    return str(path)
+def transaction_db_path():
+    """URI of a fresh in-memory transactions DB with schema."""
+    yield from memory_db("transactions", _create_transactions_schema)
 
 
 @pytest.fixture
@@ -132,42 +240,65 @@ def transaction_service(account_db_path, transaction_db_path):
 
 
 @pytest.fixture
-def historical_prices_db_path(temp_db_dir):
-    """Path to a fresh historical_prices DB with schema."""
-    path = temp_db_dir / "historical_prices.sqlite"
-    conn = sqlite3.connect(str(path))
-    _create_historical_prices_schema(conn)
-    conn.close()
-    return str(path)
+def historical_prices_db_path():
+    """URI of a fresh in-memory historical_prices DB with schema."""
+    yield from memory_db("historical_prices", _create_historical_prices_schema)
+
+
+class _ValidationQuoteService:
+    """Valid symbols: AAPL, MSFT, GOOG, NVDA, META, AMZN, TSLA. Others invalid.
+    Quote entries are built once and shared; callers only read them."""
+
+    _QUOTES = MappingProxyType({
+        sym: MappingProxyType({"current_price": 100.0, "display_name": f"{sym} Inc."})
+        for sym in ("AAPL", "MSFT", "GOOG", "NVDA", "META", "AMZN", "TSLA")
+    })
+
+    def get_quotes(self, symbols):
+        quotes = self._QUOTES
+        return {s: quotes.get(s) or {"current_price": None, "display_name": s} for s in symbols}
+
+
+_VALIDATION_QUOTE_SERVICE = _ValidationQuoteService()
 
 
 @pytest.fixture
 def transaction_service_with_validation(transaction_service, account_for_transactions):
-    """TransactionService with symbol and sell validation (mock QuoteService + PortfolioService.get_quantity_held)."""
+    """TransactionService with symbol and sell validation (_ValidationQuoteService + PortfolioService.get_quantity_held)."""
     from src.service.portfolio_service import PortfolioService
 
-    class MockQuoteService:
-        """Valid symbols: AAPL, MSFT, GOOG, NVDA, META, AMZN, TSLA. Others invalid."""
-
-        def get_quotes(self, symbols):
-            valid = {"AAPL", "MSFT", "GOOG", "NVDA", "META", "AMZN", "TSLA"}
-            result = {}
-            for sym in symbols:
-                if sym in valid:
-                    result[sym] = {"current_price": 100.0, "display_name": f"{sym} Inc."}
-                else:
-                    result[sym] = {"current_price": None, "display_name": sym}
-            return result
-
     portfolio_service = PortfolioService(transaction_service=transaction_service)
     return TransactionService(
         transaction_db_path=transaction_service._transaction_db_path,
         account_db_path=transaction_service._account_db_path,
-        quote_service=MockQuoteService(),
+        quote_service=_VALIDATION_QUOTE_SERVICE,
         get_quantity_held=portfolio_service.get_quantity_held,
     )
 
 
+def clear_all(
+    account_service: AccountService,
+    transaction_service: TransactionService,
+    keep_accounts: tuple = ("TestBroker",),
+) -> None:
+    """Empty the transactions table and drop every account except keep_accounts (inserted if missing).
+    Lets module-scoped services start each test from the same state as fresh function-scoped ones."""
+    conn = connect_db(transaction_service._transaction_db_path)
+    try:
+        conn.execute("DELETE FROM transactions")
+        conn.commit()
+    finally:
+        conn.close()
+    conn = connect_db(account_service._account_db_path)
+    try:
+        placeholders = ",".join("?" * len(keep_accounts))
+        conn.execute(f"DELETE FROM accounts WHERE name NOT IN ({placeholders})", keep_accounts)
+        conn.executemany("INSERT OR IGNORE INTO accounts (name) VALUES (?)", [(n,) for n in keep_accounts])
+        conn.commit()
+    finally:
+        conn.close()
+
+
 # ---------- Data builders for tests ----------
 
 @pytest.fixture
@@ -186,46 +317,92 @@ def account_for_transactions(account_service, sample_account_create):
     return sample_account_create.name
 
 
+@pytest.fixture
+def make_account(account_service):
+    """Factory: make_account(*names) saves the named accounts in one call (one commit) and returns the names."""
+    def _make(*names):
+        account_service.save_accounts_bulk([AccountCreate(name=n) for n in names])
+        return names[0] if len(names) == 1 else names
+    return _make
+
+
+_DEC_CACHE: dict = {}
+
+
+def _to_dec(value):
+    """Coerce int/float/str/Decimal to Decimal once per distinct value; None passes through."""
+    if value is None or isinstance(value, Decimal):
+        return value
+    key = (type(value), value)
+    dec = _DEC_CACHE.get(key)
+    if dec is None:
+        dec = Decimal(str(value))
+        _DEC_CACHE[key] = dec
+    return dec
+
+
+_DEFAULT_TXN_TIME = datetime(2025, 1, 15, 12, 0, 0)
+_DEFAULT_QUANTITY = Decimal("10")
+_DEFAULT_PRICE = Decimal("150.50")
+_DEFAULT_CASH_AMOUNT = Decimal("1000.00")
+_ZERO = Decimal("0")
+
+
 def make_transaction_create(
     account_name: str = "TestBroker",
     txn_type: TransactionType = TransactionType.BUY,
     symbol: str = "AAPL",
-    quantity=None,
-    price=None,
-    cash_amount=None,
-    fees=None,
+    quantity: Optional[Union[int, float, str, Decimal]] = None,
+    price: Optional[Union[int, float, str, Decimal]] = None,
+    cash_amount: Optional[Union[int, float, str, Decimal]] = None,
+    fees: Optional[Union[int, float, str, Decimal]] = None,
     note: str = None,
     txn_id: str = None,
     cash_destination_account: str = None,
     txn_time_est=None,
 ):
-    """Build TransactionCreate; defaults for BUY; use cash_amount for CASH_*; txn_time_est optional."""
-    from datetime import datetime
-    from decimal import Decimal
-
-    now = datetime(2025, 1, 15, 12, 0, 0) if txn_time_est is None else txn_time_est
+    """Build TransactionCreate; defaults for BUY; use cash_amount for CASH_*; txn_time_est optional.
+    Numeric fields accept int/float/str/Decimal and are coerced via a shared cache."""
+    now = _DEFAULT_TXN_TIME if txn_time_est is None else txn_time_est
     if quantity is None and txn_type in (TransactionType.BUY, TransactionType.SELL):
-        quantity = Decimal("10")
+        quantity = _DEFAULT_QUANTITY
     if price is None and txn_type in (TransactionType.BUY, TransactionType.SELL):
-        price = Decimal("150.50")
+        price = _DEFAULT_PRICE
     if cash_amount is None and txn_type in (
         TransactionType.CASH_DEPOSIT,
         TransactionType.CASH_WITHDRAW,
     ):
-        cash_amount = Decimal("1000.00")
+        cash_amount = _DEFAULT_CASH_AMOUNT
     if fees is None:
-        fees = Decimal("0")
+        fees = _ZERO
 
     return TransactionCreate(
         account_name=account_name,
         txn_type=txn_type,
         txn_time_est=now,
         symbol=symbol,
-        quantity=quantity,
-        price=price,
-        cash_amount=cash_amount,
-        fees=fees,
+        quantity=_to_dec(quantity),
+        price=_to_dec(price),
+        cash_amount=_to_dec(cash_amount),
+        fees=_to_dec(fees),
         note=note,
         txn_id=txn_id,
         cash_destination_account=cash_destination_account,
     )
+
+
+# -----------------------------------------------------------------------------
+# Fake yfinance tickers (quote tests)
+# -----------------------------------------------------------------------------
+
+
+def fake_ticker(**info):
+    """Fresh stand-in for a yfinance.Ticker whose .info is the given fields."""
+    return NS(info=info)
+
+
+def fake_tickers(mapping):
+    """Lightweight stand-in for yfinance.Tickers: symbol -> info dict (or prebuilt ticker from fake_ticker())."""
+    return NS(tickers={
+        s: info if isinstance(info, NS) else NS(info=info) for s, info in mapping.items()
+    })
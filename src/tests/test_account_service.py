@@ -2,6 +2,8 @@
 Tests for AccountService.
 Covers every public and validation path: common and edge cases.
 """
+import sqlite3
+
 import pytest
 
 from src.service.account_service import AccountService, AccountCreate
@@ -27,16 +29,10 @@ class TestAccountServiceInit:
 class TestSaveAccount:
     """Direct save_account calls (valid data only)."""
 
-    def test_save_account_persists(self, account_service, account_db_path):
+    def test_save_account_persists(self, account_service):
         acc = AccountCreate(name="BrokerOne")
         account_service.save_account(acc)
-        conn = __import__("sqlite3").connect(account_db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT name FROM accounts WHERE name = ?", ("BrokerOne",))
-        row = cur.fetchone()
-        conn.close()
-        assert row is not None
-        assert row[0] == "BrokerOne"
+        assert account_service.list_accounts() == [{"name": "BrokerOne"}]
 
     def test_save_multiple_accounts(self, account_service):
         account_service.save_account(AccountCreate(name="A1"))
@@ -46,6 +42,15 @@ class TestSaveAccount:
         assert a1[0] == "A1"
         assert a2[0] == "A2"
 
+    def test_save_accounts_bulk(self, account_service):
+        account_service.save_accounts_bulk([AccountCreate(name="B2"), AccountCreate(name="B1")])
+        assert account_service.list_accounts() == [{"name": "B1"}, {"name": "B2"}]
+
+    def test_save_accounts_bulk_duplicate_saves_nothing(self, account_service):
+        with pytest.raises(sqlite3.IntegrityError):
+            account_service.save_accounts_bulk([AccountCreate(name="D1"), AccountCreate(name="D1")])
+        assert account_service.list_accounts() == []
+
 
 # -----------------------------------------------------------------------------
 # _validate_account_create (via create_account / create_batch_account)
@@ -55,9 +60,8 @@ class TestValidateAccountCreate:
     """Validation: empty name, duplicate name."""
 
     def test_create_account_rejects_empty_name(self, account_service):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?i)required|name"):
             account_service.create_account(AccountCreate(name=""))
-        assert "required" in exc_info.value.message.lower() or "name" in exc_info.value.message.lower()
 
     def test_create_account_rejects_whitespace_only_name(self, account_service):
         # Service may or may not strip; if it doesn't, empty check might not catch.
@@ -69,9 +73,8 @@ class TestValidateAccountCreate:
 
     def test_create_account_rejects_duplicate_name(self, account_service):
         account_service.save_account(AccountCreate(name="Dup"))
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?i:already taken)|Dup"):
             account_service.create_account(AccountCreate(name="Dup"))
-        assert "already taken" in exc_info.value.message.lower() or "Dup" in exc_info.value.message
 
 
 # -----------------------------------------------------------------------------
@@ -104,11 +107,7 @@ class TestCreateBatchAccount:
     def test_create_batch_empty_list(self, account_service):
         account_service.create_batch_account([])
         # No error; no rows
-        conn = __import__("sqlite3").connect(account_service._account_db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT COUNT(*) FROM accounts")
-        assert cur.fetchone()[0] == 0
-        conn.close()
+        assert account_service.list_accounts() == []
 
     def test_create_batch_multiple_success(self, account_service):
         accounts = [
@@ -127,9 +126,8 @@ class TestCreateBatchAccount:
             AccountCreate(name="Existing"),  # duplicate
             AccountCreate(name="New2"),
         ]
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?i:already taken)|Existing"):
             account_service.create_batch_account(accounts)
-        assert "already taken" in exc_info.value.message.lower() or "Existing" in exc_info.value.message
         # First one may or may not be committed; implementation validates all then saves all, so New1 might be in DB
         # Current impl: validate each then save each, so New1 is saved before we hit Existing.
         row = account_service.get_account("New1")
@@ -150,10 +148,8 @@ class TestGetAccount:
         assert row[0] == "TestBroker"
 
     def test_get_account_not_found_raises(self, account_service):
-        with pytest.raises(NotFoundError) as exc_info:
+        with pytest.raises(NotFoundError, match=r"Account not found: NonExistent"):
             account_service.get_account("NonExistent")
-        assert "Account" in exc_info.value.message
-        assert "NonExistent" in exc_info.value.message
 
 
 # -----------------------------------------------------------------------------
@@ -168,15 +164,14 @@ class TestListAccounts:
         assert result == []
 
     def test_list_accounts_returns_small_dicts_with_name(self, account_service):
-        account_service.save_account(AccountCreate(name="BrokerA"))
-        account_service.save_account(AccountCreate(name="BrokerB"))
+        account_service.save_accounts_bulk([AccountCreate(name="BrokerA"), AccountCreate(name="BrokerB")])
         result = account_service.list_accounts()
         assert result == [{"name": "BrokerA"}, {"name": "BrokerB"}]
 
     def test_list_accounts_ordered_by_name(self, account_service):
-        account_service.save_account(AccountCreate(name="Zebra"))
-        account_service.save_account(AccountCreate(name="Alpha"))
-        account_service.save_account(AccountCreate(name="Middle"))
+        account_service.save_accounts_bulk(
+            [AccountCreate(name="Zebra"), AccountCreate(name="Alpha"), AccountCreate(name="Middle")]
+        )
         result = account_service.list_accounts()
         assert [d["name"] for d in result] == ["Alpha", "Middle", "Zebra"]
 
@@ -185,6 +180,14 @@ class TestListAccounts:
 # edit_account
 # -----------------------------------------------------------------------------
 
+_EDIT_ACCOUNT_ERROR_CASES = [
+    pytest.param((), "", "Any", ValidationError, r"(?i)old|required", id="empty_old_name"),
+    pytest.param(("Exists",), "Exists", "", ValidationError, r"(?i)new|required", id="empty_new_name"),
+    pytest.param(("A", "B"), "A", "B", ValidationError, r"(?i)already taken", id="new_name_taken"),
+    pytest.param((), "NoSuch", "New", NotFoundError, r"Account not found: NoSuch", id="old_name_not_found"),
+]
+
+
 class TestEditAccount:
     """edit_account: success, validation, not found."""
 
@@ -203,29 +206,11 @@ class TestEditAccount:
         assert result[0] == "Same"
         assert account_service.get_account("Same")[0] == "Same"
 
-    def test_edit_account_rejects_empty_old_name(self, account_service):
-        with pytest.raises(ValidationError) as exc_info:
-            account_service.edit_account("", AccountCreate(name="Any"))
-        assert "old" in exc_info.value.message.lower() or "required" in exc_info.value.message.lower()
-
-    def test_edit_account_rejects_empty_new_name(self, account_service):
-        account_service.save_account(AccountCreate(name="Exists"))
-        with pytest.raises(ValidationError) as exc_info:
-            account_service.edit_account("Exists", AccountCreate(name=""))
-        assert "new" in exc_info.value.message.lower() or "required" in exc_info.value.message.lower()
-
-    def test_edit_account_rejects_new_name_already_taken(self, account_service):
-        account_service.save_account(AccountCreate(name="A"))
-        account_service.save_account(AccountCreate(name="B"))
-        with pytest.raises(ValidationError) as exc_info:
-            account_service.edit_account("A", AccountCreate(name="B"))
-        assert "already taken" in exc_info.value.message.lower()
-
-    def test_edit_account_old_name_not_found_raises(self, account_service):
-        with pytest.raises(NotFoundError) as exc_info:
-            account_service.edit_account("NoSuch", AccountCreate(name="New"))
-        assert "Account" in exc_info.value.message
-        assert "NoSuch" in exc_info.value.message
+    @pytest.mark.parametrize("existing, old_name, new_name, exc, match", _EDIT_ACCOUNT_ERROR_CASES)
+    def test_edit_account_invalid_raises(self, account_service, existing, old_name, new_name, exc, match):
+        account_service.save_accounts_bulk([AccountCreate(name=n) for n in existing])
+        with pytest.raises(exc, match=match):
+            account_service.edit_account(old_name, AccountCreate(name=new_name))
 
 
 # -----------------------------------------------------------------------------
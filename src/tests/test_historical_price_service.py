@@ -8,6 +8,7 @@ from datetime import date, datetime, timedelta
 import pytest
 
 from src.service.historical_price_service import HistoricalPriceService
+from src.service.util import connect_db
 
 
 @pytest.fixture
@@ -74,7 +75,6 @@ def test_get_historical_prices_persists_to_db(
 ):
     """After fetch, data is in SQLite; second call (no refresh) can use cache."""
     import pandas as pd
-    import sqlite3
 
     call_count = [0]
 
@@ -91,7 +91,7 @@ def test_get_historical_prices_persists_to_db(
         ["MSFT"], date(2024, 6, 1), date(2024, 6, 3)
     )
     assert call_count[0] == 1
-    conn = sqlite3.connect(historical_prices_db_path)
+    conn = connect_db(historical_prices_db_path)
     cur = conn.cursor()
     cur.execute(
         "SELECT symbol, date, close_price FROM historical_prices WHERE symbol = 'MSFT'"
@@ -129,7 +129,6 @@ def test_get_price_on_date_empty_symbol_returns_none(historical_price_service):
 def test_price_type_close_stored(historical_price_service, historical_prices_db_path, monkeypatch):
     """V1 stores price_type = 'close'."""
     import pandas as pd
-    import sqlite3
 
     def mock_download(*args, **kwargs):
         idx = pd.DatetimeIndex([pd.Timestamp("2024-03-01")])
@@ -142,7 +141,7 @@ def test_price_type_close_stored(historical_price_service, historical_prices_db_
     historical_price_service.get_historical_prices(
         ["GOOG"], date(2024, 3, 1), date(2024, 3, 1)
     )
-    conn = sqlite3.connect(historical_prices_db_path)
+    conn = connect_db(historical_prices_db_path)
     cur = conn.cursor()
     cur.execute("SELECT price_type FROM historical_prices WHERE symbol = 'GOOG' LIMIT 1")
     row = cur.fetchone()
@@ -1,13 +1,4 @@
 """Tests for main app endpoints: root and health (packaging readiness)."""
-import pytest
-from fastapi.testclient import TestClient
-
-from src.app.main import app
-
-
-@pytest.fixture
-def client():
-    return TestClient(app)
 
 
 def test_root(client):
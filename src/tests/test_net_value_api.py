@@ -1,15 +1,12 @@
 """
 Integration tests for GET /net-value-curve API.
-Uses TestClient; patches net value service to use test DBs and mock prices.
+Uses the session TestClient; patches net value service to use test DBs and mock prices.
 """
 
 from datetime import date, datetime, timedelta
 
 import pytest
-from fastapi.testclient import TestClient
 
-from src.app.main import app
-from src.service.transaction_service import TransactionService
 from src.service.historical_price_service import HistoricalPriceService
 from src.service.net_value_service import NetValueService
 from decimal import Decimal
@@ -65,20 +62,14 @@ def net_value_service_for_api(
 
 @pytest.fixture
 def client_with_net_value(
+    client,
     net_value_service_for_api,
-    transaction_service,
-    account_for_transactions,
+    monkeypatch,
 ):
-    """Patch the router's _get_net_value_service to return our test service."""
-    from src.app.api import routers
-    net_value_router = routers.net_value
-    original = net_value_router._get_net_value_service
-    net_value_router._get_net_value_service = lambda: net_value_service_for_api
-    try:
-        with TestClient(app) as c:
-            yield c
-    finally:
-        net_value_router._get_net_value_service = original
+    """Session client with the router's _get_net_value_service patched to return our test service."""
+    from src.app.api.routers import net_value as net_value_router
+    monkeypatch.setattr(net_value_router, "_get_net_value_service", lambda: net_value_service_for_api)
+    return client
 
 
 class TestNetValueCurveAPI:
@@ -4,7 +4,6 @@ Covers boundary conditions, error cases, and unusual scenarios.
 """
 
 from datetime import date, datetime, timedelta
-from decimal import Decimal
 
 import pytest
 
@@ -73,7 +72,7 @@ class TestEdgeCasesEmptyData:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="single",
             )
@@ -95,7 +94,7 @@ class TestEdgeCasesEmptyData:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("5000"),
+                cash_amount=5000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="before",
             )
@@ -104,7 +103,7 @@ class TestEdgeCasesEmptyData:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2024, 1, 10),
                 txn_id="during",
             )
@@ -132,7 +131,7 @@ class TestEdgeCasesEmptyData:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2024, 1, 10),
                 txn_id="during",
             )
@@ -141,7 +140,7 @@ class TestEdgeCasesEmptyData:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("5000"),
+                cash_amount=5000,
                 txn_time_est=datetime(2024, 1, 20),
                 txn_id="after",
             )
@@ -160,18 +159,16 @@ class TestEdgeCasesMultipleAccounts:
     """Edge cases with multiple accounts."""
 
     def test_multiple_accounts_separate(
-        self, net_value_service, transaction_service, account_service, account_for_transactions
+        self, net_value_service, transaction_service, make_account, account_for_transactions
     ):
         """Multiple accounts with separate transactions."""
-        from src.service.account_service import AccountCreate
-        account2 = "Account2"
-        account_service.save_account(AccountCreate(name=account2))
+        account2 = make_account("Account2")
         
         transaction_service.create_transaction(
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2024, 1, 10),
                 txn_id="acc1",
             )
@@ -180,7 +177,7 @@ class TestEdgeCasesMultipleAccounts:
             make_transaction_create(
                 account_name=account2,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("2000"),
+                cash_amount=2000,
                 txn_time_est=datetime(2024, 1, 10),
                 txn_id="acc2",
             )
@@ -233,7 +230,7 @@ class TestEdgeCasesDateBoundaries:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2024, 6, 15),
                 txn_id="same",
             )
@@ -254,7 +251,7 @@ class TestEdgeCasesDateBoundaries:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2023, 12, 31),
                 txn_id="year_end",
             )
@@ -263,7 +260,7 @@ class TestEdgeCasesDateBoundaries:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("2000"),
+                cash_amount=2000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="year_start",
             )
@@ -285,7 +282,7 @@ class TestEdgeCasesDateBoundaries:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2024, 2, 29),  # 2024 is a leap year
                 txn_id="leap",
             )
@@ -319,8 +316,8 @@ class TestEdgeCasesAvgCostMechanics:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
+                quantity=10,
+                price=100,
                 txn_time_est=datetime(2024, 1, 15, 10, 0),
                 txn_id="buy1",
             )
@@ -330,8 +327,8 @@ class TestEdgeCasesAvgCostMechanics:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("20"),
-                price=Decimal("110"),
+                quantity=20,
+                price=110,
                 txn_time_est=datetime(2024, 1, 15, 14, 0),
                 txn_id="buy2",
             )
@@ -357,8 +354,8 @@ class TestEdgeCasesAvgCostMechanics:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
+                quantity=10,
+                price=100,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy",
             )
@@ -380,8 +377,8 @@ class TestEdgeCasesCashFlow:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
+                quantity=10,
+                price=100,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy_no_cash",
             )
@@ -405,7 +402,7 @@ class TestEdgeCasesCashFlow:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="deposit",
             )
@@ -414,7 +411,7 @@ class TestEdgeCasesCashFlow:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_WITHDRAW,
-                cash_amount=Decimal("2000"),
+                cash_amount=2000,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="withdraw",
             )
@@ -436,7 +433,7 @@ class TestEdgeCasesCashFlow:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
+                cash_amount=1000,
                 txn_time_est=datetime(2024, 1, 15, 9, 0),
                 txn_id="dep1",
             )
@@ -445,7 +442,7 @@ class TestEdgeCasesCashFlow:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("2000"),
+                cash_amount=2000,
                 txn_time_est=datetime(2024, 1, 15, 10, 0),
                 txn_id="dep2",
             )
@@ -454,7 +451,7 @@ class TestEdgeCasesCashFlow:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_WITHDRAW,
-                cash_amount=Decimal("500"),
+                cash_amount=500,
                 txn_time_est=datetime(2024, 1, 15, 11, 0),
                 txn_id="withdraw",
             )
@@ -501,8 +498,8 @@ class TestEdgeCasesPriceData:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="UNKNOWN",
-                quantity=Decimal("10"),
-                price=Decimal("50"),
+                quantity=10,
+                price=50,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy_unknown",
             )
@@ -547,8 +544,8 @@ class TestEdgeCasesPriceData:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
+                quantity=10,
+                price=100,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy",
             )
@@ -586,8 +583,8 @@ class TestEdgeCasesPercents:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
+                quantity=10,
+                price=100,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy",
             )
@@ -597,8 +594,8 @@ class TestEdgeCasesPercents:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.SELL,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
+                quantity=10,
+                price=100,
                 txn_time_est=datetime(2024, 1, 16),
                 txn_id="sell",
             )
@@ -622,8 +619,8 @@ class TestEdgeCasesPercents:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("0.01"),  # Small but non-zero quantity
-                price=Decimal("1.00"),  # Small price
+                quantity="0.01",  # Small but non-zero quantity
+                price="1.00",  # Small price
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="tiny",
             )
@@ -651,7 +648,7 @@ class TestEdgeCasesIncludeCash:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("5000"),
+                cash_amount=5000,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="cash",
             )
@@ -661,8 +658,8 @@ class TestEdgeCasesIncludeCash:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
+                quantity=10,
+                price=100,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy",
             )
@@ -4,7 +4,6 @@ Tests complete workflows and data integrity.
 """
 
 from datetime import date, datetime, timedelta
-from decimal import Decimal
 import random
 
 import pytest
@@ -115,7 +114,7 @@ class TestIntegrationRealisticScenarios:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="deposit",
             )
@@ -136,8 +135,8 @@ class TestIntegrationRealisticScenarios:
                     account_name=account_for_transactions,
                     txn_type=TransactionType.BUY,
                     symbol="AAPL",
-                    quantity=Decimal("6.67"),
-                    price=Decimal("150"),
+                    quantity="6.67",
+                    price=150,
                     txn_time_est=txn_date,
                     txn_id=f"dca_{month}",
                 )
@@ -176,7 +175,7 @@ class TestIntegrationRealisticScenarios:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("50000"),
+                cash_amount=50000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="deposit",
             )
@@ -190,8 +189,8 @@ class TestIntegrationRealisticScenarios:
                     account_name=account_for_transactions,
                     txn_type=TransactionType.BUY,
                     symbol=sym,
-                    quantity=Decimal("10"),
-                    price=Decimal("100"),
+                    quantity=10,
+                    price=100,
                     txn_time_est=datetime(2024, 1, 15),
                     txn_id=f"init_{sym}",
                 )
@@ -211,8 +210,8 @@ class TestIntegrationRealisticScenarios:
                     account_name=account_for_transactions,
                     txn_type=TransactionType.SELL,
                     symbol="AAPL",
-                    quantity=Decimal("2"),
-                    price=Decimal("160"),
+                    quantity=2,
+                    price=160,
                     txn_time_est=rebal_date,
                     txn_id=f"rebal_sell_aapl_{rebal_date.month}",
                 )
@@ -223,8 +222,8 @@ class TestIntegrationRealisticScenarios:
                     account_name=account_for_transactions,
                     txn_type=TransactionType.BUY,
                     symbol="MSFT",
-                    quantity=Decimal("5"),
-                    price=Decimal("320"),
+                    quantity=5,
+                    price=320,
                     txn_time_est=rebal_date,
                     txn_id=f"rebal_buy_msft_{rebal_date.month}",
                 )
@@ -257,7 +256,7 @@ class TestIntegrationRealisticScenarios:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("20000"),
+                cash_amount=20000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="deposit",
             )
@@ -269,8 +268,8 @@ class TestIntegrationRealisticScenarios:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="TSLA",
-                quantity=Decimal("50"),
-                price=Decimal("200"),
+                quantity=50,
+                price=200,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy_tsla",
             )
@@ -282,8 +281,8 @@ class TestIntegrationRealisticScenarios:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.SELL,
                 symbol="TSLA",
-                quantity=Decimal("50"),
-                price=Decimal("180"),  # Loss of $20/share
+                quantity=50,
+                price=180,  # Loss of $20/share
                 txn_time_est=datetime(2024, 6, 15),
                 txn_id="harvest_loss",
             )
@@ -295,8 +294,8 @@ class TestIntegrationRealisticScenarios:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AMZN",
-                quantity=Decimal("50"),
-                price=Decimal("150"),
+                quantity=50,
+                price=150,
                 txn_time_est=datetime(2024, 6, 16),
                 txn_id="buy_amzn",
             )
@@ -311,8 +310,8 @@ class TestIntegrationRealisticScenarios:
         
         # After harvesting, baseline should reset (sold all TSLA)
         # Then new baseline from AMZN purchase
-        june_15_idx = next(i for i, d in enumerate(out["dates"]) if d == "2024-06-15")
-        june_16_idx = next(i for i, d in enumerate(out["dates"]) if d == "2024-06-16")
+        june_15_idx = out["dates"].index("2024-06-15")
+        june_16_idx = out["dates"].index("2024-06-16")
         
         # After sell: baseline should drop to 0 (all sold)
         assert out["baseline"][june_15_idx] == 0.0
@@ -332,7 +331,7 @@ class TestIntegrationDataIntegrity:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="deposit",
             )
@@ -342,8 +341,8 @@ class TestIntegrationDataIntegrity:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("150"),
+                quantity=10,
+                price=150,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy",
             )
@@ -372,8 +371,8 @@ class TestIntegrationDataIntegrity:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
+                quantity=10,
+                price=100,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy",
             )
@@ -405,7 +404,7 @@ class TestIntegrationDataIntegrity:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="deposit",
             )
@@ -425,8 +424,8 @@ class TestIntegrationDataIntegrity:
                     account_name=account_for_transactions,
                     txn_type=TransactionType.BUY,
                     symbol="AAPL",
-                    quantity=Decimal("10"),
-                    price=Decimal("150"),
+                    quantity=10,
+                    price=150,
                     txn_time_est=datetime.combine(buy_date, datetime.min.time()),
                     txn_id=f"buy_{i}",
                 )
@@ -452,7 +451,7 @@ class TestIntegrationDataIntegrity:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="deposit",
             )
@@ -462,8 +461,8 @@ class TestIntegrationDataIntegrity:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("150"),
+                quantity=10,
+                price=150,
                 txn_time_est=datetime(2024, 1, 15),
                 txn_id="buy",
             )
@@ -512,7 +511,7 @@ class TestIntegrationComplexScenarios:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("50000"),
+                cash_amount=50000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="year_start",
             )
@@ -534,8 +533,8 @@ class TestIntegrationComplexScenarios:
                     account_name=account_for_transactions,
                     txn_type=TransactionType.BUY,
                     symbol=sym,
-                    quantity=Decimal(str(qty)),
-                    price=Decimal("100"),
+                    quantity=qty,
+                    price=100,
                     txn_time_est=datetime(2024, 1, 15),
                     txn_id=f"init_{sym}",
                 )
@@ -548,8 +547,8 @@ class TestIntegrationComplexScenarios:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.SELL,
                 symbol="AAPL",
-                quantity=Decimal("5"),
-                price=Decimal("160"),
+                quantity=5,
+                price=160,
                 txn_time_est=datetime(2024, 6, 15),
                 txn_id="rebal_sell",
             )
@@ -559,8 +558,8 @@ class TestIntegrationComplexScenarios:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="MSFT",
-                quantity=Decimal("10"),
-                price=Decimal("320"),
+                quantity=10,
+                price=320,
                 txn_time_est=datetime(2024, 6, 16),
                 txn_id="rebal_buy",
             )
@@ -571,7 +570,7 @@ class TestIntegrationComplexScenarios:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime(2024, 12, 1),
                 txn_id="year_end_deposit",
             )
@@ -4,7 +4,6 @@ Tests scalability with many transactions, symbols, and date ranges.
 """
 
 from datetime import date, datetime, timedelta
-from decimal import Decimal
 import time
 
 import pytest
@@ -14,6 +13,8 @@ from src.service.historical_price_service import HistoricalPriceService
 from src.service.enums import TransactionType
 from src.tests.conftest import make_transaction_create
 
+pytestmark = pytest.mark.slow
+
 
 def _date_str(d):
     return d.isoformat()
@@ -66,34 +67,36 @@ class TestPerformanceLargeDatasets:
         num_transactions = 100
         start_date = date(2024, 1, 1)
         
+        txns = []
         for i in range(num_transactions):
             txn_date = start_date + timedelta(days=i * 3)  # Every 3 days
             if i % 2 == 0:
                 # Buy
-                transaction_service.create_transaction(
+                txns.append(
                     make_transaction_create(
                         account_name=account_for_transactions,
                         txn_type=TransactionType.BUY,
                         symbol="AAPL",
-                        quantity=Decimal("10"),
-                        price=Decimal("100"),
+                        quantity=10,
+                        price=100,
                         txn_time_est=datetime.combine(txn_date, datetime.min.time()),
                         txn_id=f"buy_{i}",
                     )
                 )
             else:
                 # Sell
-                transaction_service.create_transaction(
+                txns.append(
                     make_transaction_create(
                         account_name=account_for_transactions,
                         txn_type=TransactionType.SELL,
                         symbol="AAPL",
-                        quantity=Decimal("5"),
-                        price=Decimal("100"),
+                        quantity=5,
+                        price=100,
                         txn_time_est=datetime.combine(txn_date, datetime.min.time()),
                         txn_id=f"sell_{i}",
                     )
                 )
+        transaction_service.create_batch_transaction(txns)
         
         start_time = time.time()
         out = net_value_service_large.get_net_value_curve(
@@ -115,18 +118,18 @@ class TestPerformanceLargeDatasets:
         symbols = [f"SYM{i:03d}" for i in range(num_symbols)]
         txn_date = date(2024, 1, 15)
         
-        for sym in symbols:
-            transaction_service.create_transaction(
-                make_transaction_create(
-                    account_name=account_for_transactions,
-                    txn_type=TransactionType.BUY,
-                    symbol=sym,
-                    quantity=Decimal("10"),
-                    price=Decimal("100"),
-                    txn_time_est=datetime.combine(txn_date, datetime.min.time()),
-                    txn_id=f"buy_{sym}",
-                )
+        transaction_service.create_batch_transaction([
+            make_transaction_create(
+                account_name=account_for_transactions,
+                txn_type=TransactionType.BUY,
+                symbol=sym,
+                quantity=10,
+                price=100,
+                txn_time_est=datetime.combine(txn_date, datetime.min.time()),
+                txn_id=f"buy_{sym}",
             )
+            for sym in symbols
+        ])
         
         start_time = time.time()
         out = net_value_service_large.get_net_value_curve(
@@ -152,7 +155,7 @@ class TestPerformanceLargeDatasets:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime.combine(start_date, datetime.min.time()),
                 txn_id="start",
             )
@@ -162,8 +165,8 @@ class TestPerformanceLargeDatasets:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("100"),
-                price=Decimal("100"),
+                quantity=100,
+                price=100,
                 txn_time_est=datetime.combine(start_date + timedelta(days=100), datetime.min.time()),
                 txn_id="buy",
             )
@@ -173,8 +176,8 @@ class TestPerformanceLargeDatasets:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.SELL,
                 symbol="AAPL",
-                quantity=Decimal("50"),
-                price=Decimal("150"),
+                quantity=50,
+                price=150,
                 txn_time_est=datetime.combine(end_date - timedelta(days=100), datetime.min.time()),
                 txn_id="sell",
             )
@@ -202,22 +205,24 @@ class TestPerformanceLargeDatasets:
         
         # Add a transaction every trading day (weekdays only)
         current = start_date
+        txns = []
         txn_count = 0
         while current <= end_date:
             if current.weekday() < 5:  # Monday-Friday
-                transaction_service.create_transaction(
+                txns.append(
                     make_transaction_create(
                         account_name=account_for_transactions,
                         txn_type=TransactionType.BUY if txn_count % 2 == 0 else TransactionType.SELL,
                         symbol="AAPL",
-                        quantity=Decimal("1"),
-                        price=Decimal("100"),
+                        quantity=1,
+                        price=100,
                         txn_time_est=datetime.combine(current, datetime.min.time()),
                         txn_id=f"txn_{txn_count}",
                     )
                 )
                 txn_count += 1
             current += timedelta(days=1)
+        transaction_service.create_batch_transaction(txns)
         
         start_time = time.time()
         out = net_value_service_large.get_net_value_curve(
@@ -237,28 +242,26 @@ class TestPerformanceLargeDatasets:
         """Multiple accounts with many transactions each."""
         num_accounts = 5
         from src.service.account_service import AccountCreate
-        accounts = [account_for_transactions]
-        for i in range(1, num_accounts):
-            acc_name = f"Account{i}"
-            account_service.save_account(AccountCreate(name=acc_name))
-            accounts.append(acc_name)
+        extra_accounts = [f"Account{i}" for i in range(1, num_accounts)]
+        account_service.save_accounts_bulk([AccountCreate(name=n) for n in extra_accounts])
+        accounts = [account_for_transactions, *extra_accounts]
         
         txn_date = date(2024, 1, 15)
         transactions_per_account = 50
         
-        for acc in accounts:
-            for i in range(transactions_per_account):
-                transaction_service.create_transaction(
-                    make_transaction_create(
-                        account_name=acc,
-                        txn_type=TransactionType.BUY,
-                        symbol=f"SYM{i % 10}",  # 10 different symbols per account
-                        quantity=Decimal("10"),
-                        price=Decimal("100"),
-                        txn_time_est=datetime.combine(txn_date + timedelta(days=i), datetime.min.time()),
-                        txn_id=f"{acc}_buy_{i}",
-                    )
-                )
+        transaction_service.create_batch_transaction([
+            make_transaction_create(
+                account_name=acc,
+                txn_type=TransactionType.BUY,
+                symbol=f"SYM{i % 10}",  # 10 different symbols per account
+                quantity=10,
+                price=100,
+                txn_time_est=datetime.combine(txn_date + timedelta(days=i), datetime.min.time()),
+                txn_id=f"{acc}_buy_{i}",
+            )
+            for acc in accounts
+            for i in range(transactions_per_account)
+        ])
         
         start_time = time.time()
         out = net_value_service_large.get_net_value_curve(
@@ -287,7 +290,7 @@ class TestPerformanceMemoryUsage:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime.combine(start_date, datetime.min.time()),
                 txn_id="deposit",
             )
@@ -330,7 +333,7 @@ class TestPerformanceConcurrentScenarios:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("50000"),
+                cash_amount=50000,
                 txn_time_est=datetime(2024, 1, 1),
                 txn_id="init_deposit",
             )
@@ -351,8 +354,8 @@ class TestPerformanceConcurrentScenarios:
                     account_name=account_for_transactions,
                     txn_type=TransactionType.BUY,
                     symbol=sym,
-                    quantity=Decimal("10"),
-                    price=Decimal("100"),
+                    quantity=10,
+                    price=100,
                     txn_time_est=datetime.combine(buy_dates[i], datetime.min.time()),
                     txn_id=f"buy_{sym}",
                 )
@@ -364,8 +367,8 @@ class TestPerformanceConcurrentScenarios:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.SELL,
                 symbol="AAPL",
-                quantity=Decimal("5"),
-                price=Decimal("120"),
+                quantity=5,
+                price=120,
                 txn_time_est=datetime(2024, 6, 1),
                 txn_id="sell_aapl",
             )
@@ -376,7 +379,7 @@ class TestPerformanceConcurrentScenarios:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime(2024, 9, 1),
                 txn_id="add_deposit",
             )
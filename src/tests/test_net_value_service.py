@@ -4,7 +4,6 @@ Mock HistoricalPriceService to return controlled prices.
 """
 
 from datetime import date, datetime
-from decimal import Decimal
 
 import pytest
 
@@ -78,9 +77,9 @@ class TestNetValueCurveAvgCostMechanics:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("150"),
-                fees=Decimal("5"),
+                quantity=10,
+                price=150,
+                fees=5,
                 txn_time_est=datetime(2024, 6, 1, 10, 0, 0),
                 txn_id="b1",
             )
@@ -105,9 +104,9 @@ class TestNetValueCurveAvgCostMechanics:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("20"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
+                quantity=20,
+                price=100,
+                fees=0,
                 txn_time_est=datetime(2024, 7, 1),
                 txn_id="b2",
             )
@@ -117,9 +116,9 @@ class TestNetValueCurveAvgCostMechanics:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.SELL,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("120"),
-                fees=Decimal("0"),
+                quantity=10,
+                price=120,
+                fees=0,
                 txn_time_est=datetime(2024, 7, 2),
                 txn_id="s2",
             )
@@ -145,8 +144,8 @@ class TestNetValueCurveAvgCostMechanics:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="MSFT",
-                quantity=Decimal("5"),
-                price=Decimal("200"),
+                quantity=5,
+                price=200,
                 txn_time_est=datetime(2024, 8, 1),
                 txn_id="b3",
             )
@@ -156,8 +155,8 @@ class TestNetValueCurveAvgCostMechanics:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.SELL,
                 symbol="MSFT",
-                quantity=Decimal("5"),
-                price=Decimal("220"),
+                quantity=5,
+                price=220,
                 txn_time_est=datetime(2024, 8, 2),
                 txn_id="s3",
             )
@@ -182,7 +181,7 @@ class TestNetValueCurveCash:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("5000"),
+                cash_amount=5000,
                 txn_time_est=datetime(2024, 9, 1),
                 txn_id="c1",
             )
@@ -224,8 +223,8 @@ class TestNetValueCurveResponseShape:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("1"),
-                price=Decimal("100"),
+                quantity=1,
+                price=100,
                 txn_time_est=datetime(2024, 10, 1),
                 txn_id="b4",
             )
@@ -259,8 +258,8 @@ class TestNetValueCurveTransactionDate:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("50"),
+                quantity=10,
+                price=50,
                 txn_time_est=datetime(2024, 11, 5, 14, 30, 0),
                 txn_id="b5",
             )
@@ -272,7 +271,7 @@ class TestNetValueCurveTransactionDate:
             include_cash=False,  # Stock-only mode for this test
         )
         # On 2024-11-05 we have the position and value
-        nov5_idx = next(i for i, d in enumerate(out["dates"]) if d == "2024-11-05")
+        nov5_idx = out["dates"].index("2024-11-05")
         assert out["baseline"][nov5_idx] == 500.0  # Stock cost only
         assert out["market_value"][nov5_idx] == 1000.0  # 10*100 mock (stock_mv only, no cash)
 
@@ -294,7 +293,7 @@ class TestNetValueCurveCashDepositRegression:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("50000"),
+                cash_amount=50000,
                 txn_time_est=datetime(2024, 12, 1, 9, 0, 0),
                 txn_id="dep0",
             )
@@ -328,7 +327,7 @@ class TestNetValueCurveCashDepositRegression:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("100000"),
+                cash_amount=100000,
                 txn_time_est=datetime(2024, 12, 1, 9, 0, 0),
                 txn_id="dep1",
             )
@@ -339,9 +338,9 @@ class TestNetValueCurveCashDepositRegression:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("80"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
+                quantity=80,
+                price=100,
+                fees=0,
                 txn_time_est=datetime(2024, 12, 1, 10, 0, 0),
                 txn_id="buy1",
             )
@@ -394,7 +393,7 @@ class TestNetValueCurveCashDepositRegression:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("10000"),
+                cash_amount=10000,
                 txn_time_est=datetime(2024, 12, 2, 9, 0, 0),
                 txn_id="dep2",
             )
@@ -405,9 +404,9 @@ class TestNetValueCurveCashDepositRegression:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
+                quantity=10,
+                price=100,
+                fees=0,
                 txn_time_est=datetime(2024, 12, 2, 10, 0, 0),
                 txn_id="buy2",
             )
@@ -418,9 +417,9 @@ class TestNetValueCurveCashDepositRegression:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.SELL,
                 symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
+                quantity=10,
+                price=100,
+                fees=0,
                 txn_time_est=datetime(2024, 12, 2, 11, 0, 0),
                 txn_id="sell2",
             )
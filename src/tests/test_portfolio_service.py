@@ -3,15 +3,49 @@ Tests for PortfolioService and GET /portfolio.
 Portfolio is computed from transactions: cash balance and positions (symbol, quantity, total_cost).
 """
 from decimal import Decimal
+from functools import partial
+from types import MappingProxyType
 
 import pytest
-from fastapi.testclient import TestClient
 
 from src.service.portfolio_service import PortfolioService
-from src.service.account_service import AccountCreate
+from src.service.account_service import AccountService
+from src.service.transaction_service import TransactionService
 from src.service.enums import TransactionType
-from src.app.main import app
-from src.tests.conftest import make_transaction_create
+from src.service.util import normalize_symbol, round2
+from src.tests.conftest import (
+    _create_accounts_schema,
+    _create_transactions_schema,
+    clear_all,
+    clear_app_db,
+    make_transaction_create,
+    memory_db,
+)
+
+DEFAULT_ACCOUNT = "TestBroker"
+
+# make_transaction_create bound to the default account (most tests in this module use it).
+_mk = partial(make_transaction_create, account_name=DEFAULT_ACCOUNT)
+
+
+def _buy(symbol, qty, price, fees=0, **kwargs):
+    """BUY on the default account; numeric args may be int/str/Decimal."""
+    return _mk(txn_type=TransactionType.BUY, symbol=symbol, quantity=qty, price=price, fees=fees, **kwargs)
+
+
+def _sell(symbol, qty, price, fees=0, **kwargs):
+    """SELL on the default account; numeric args may be int/str/Decimal."""
+    return _mk(txn_type=TransactionType.SELL, symbol=symbol, quantity=qty, price=price, fees=fees, **kwargs)
+
+
+def _deposit(amount, **kwargs):
+    """CASH_DEPOSIT on the default account."""
+    return _mk(txn_type=TransactionType.CASH_DEPOSIT, cash_amount=amount, **kwargs)
+
+
+def _withdraw(amount, **kwargs):
+    """CASH_WITHDRAW on the default account."""
+    return _mk(txn_type=TransactionType.CASH_WITHDRAW, cash_amount=amount, **kwargs)
 
 
 # -----------------------------------------------------------------------------
@@ -19,50 +53,121 @@ from src.tests.conftest import make_transaction_create
 # -----------------------------------------------------------------------------
 
 
+# Services and in-memory DBs are shared by the whole module; before every test _reset deletes all
+# transactions and keeps exactly the default account plus the `brokers` accounts (re-inserting any
+# that are missing), so tests stay independent.
+
+
+@pytest.fixture(scope="module")
+def account_db_path():
+    yield from memory_db("accounts", _create_accounts_schema)
+
+
+@pytest.fixture(scope="module")
+def transaction_db_path():
+    yield from memory_db("transactions", _create_transactions_schema)
+
+
+@pytest.fixture(scope="module")
+def account_service(account_db_path):
+    return AccountService(account_db_path=account_db_path)
+
+
+@pytest.fixture(scope="module")
+def transaction_service(account_db_path, transaction_db_path):
+    return TransactionService(
+        transaction_db_path=transaction_db_path,
+        account_db_path=account_db_path,
+    )
+
+
+@pytest.fixture(scope="module")
+def account_for_transactions():
+    """Default account; re-seeded by _reset before each test."""
+    return DEFAULT_ACCOUNT
+
+
+@pytest.fixture(scope="module")
+def brokers():
+    """Extra accounts used by multi-account tests; kept seeded by _reset for the whole module."""
+    return ("BrokerA", "BrokerB", "Savings", "EmptyAcct")
+
+
+@pytest.fixture(autouse=True)
+def _reset(account_service, transaction_service, account_for_transactions, brokers):
+    clear_all(account_service, transaction_service, keep_accounts=(account_for_transactions, *brokers))
+
+
 @pytest.fixture
 def portfolio_service(transaction_service):
     """PortfolioService wired to the same test transaction DB as transaction_service."""
     return PortfolioService(transaction_service=transaction_service)
 
 
-class TestPortfolioCashOnly:
-    """Only CASH_DEPOSIT / CASH_WITHDRAW -> cash balance only, no positions."""
-
-    def test_cash_deposit_only(
-        self, portfolio_service, account_for_transactions
+_SINGLE_TXN_CASES = [
+    pytest.param(
+        dict(txn_type=TransactionType.CASH_DEPOSIT, cash_amount="1000.00"),
+        1000.0,
+        [],
+        id="cash_deposit_only",
+    ),
+    # BUY 10 @ 150.50 + 0 fees -> cash -1505.00 (no deposit, so negative), total_cost 1505.00
+    pytest.param(
+        dict(txn_type=TransactionType.BUY, symbol="AAPL", quantity=10, price="150.50", fees=0),
+        -1505.00,
+        [("AAPL", 10.0, 1505.00)],
+        id="single_buy_position",
+    ),
+    # -(5*200 + 2.50); total_cost includes fees
+    pytest.param(
+        dict(txn_type=TransactionType.BUY, symbol="MSFT", quantity=5, price=200, fees="2.50"),
+        -1002.50,
+        [("MSFT", 5.0, 1002.50)],
+        id="buy_with_fees",
+    ),
+    # Symbols are stripped and uppercased
+    pytest.param(
+        dict(txn_type=TransactionType.BUY, symbol="  aapl  ", quantity=1, price=100),
+        -100.0,
+        [("AAPL", 1.0, 100.0)],
+        id="symbol_uppercase",
+    ),
+    # Cash rounded to 2 decimals
+    pytest.param(
+        dict(txn_type=TransactionType.CASH_DEPOSIT, cash_amount="123.456"),
+        123.46,
+        [],
+        id="cash_two_decimals",
+    ),
+]
+
+
+class TestPortfolioSingleTransaction:
+    """One transaction -> expected cash balance and (symbol, quantity, total_cost) positions."""
+
+    @pytest.mark.parametrize("txn_kwargs, expected_cash, expected_positions", _SINGLE_TXN_CASES)
+    def test_single_txn_summary(
+        self, portfolio_service, txn_kwargs, expected_cash, expected_positions
     ):
-        portfolio_service._txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000.00"),
-                txn_id="c0",
-            )
-        )
+        portfolio_service._txn_svc.create_transaction(_mk(txn_id="single", **txn_kwargs))
         summary = portfolio_service.get_summary(account_names=None)
-        assert summary["cash_balance"] == 1000.0
-        assert summary["positions"] == []
+        assert summary["cash_balance"] == expected_cash
+        assert [
+            (p["symbol"], p["quantity"], p["total_cost"]) for p in summary["positions"]
+        ] == expected_positions
+
+
+class TestPortfolioCashOnly:
+    """Only CASH_DEPOSIT / CASH_WITHDRAW -> cash balance only, no positions."""
 
     def test_deposit_and_withdraw_cash_only(
         self, portfolio_service, account_for_transactions
     ):
         txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000.00"),
-                txn_id="c1",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_WITHDRAW,
-                cash_amount=Decimal("200.50"),
-                txn_id="c2",
-            )
-        )
+        txn_svc.create_batch_transaction([
+            _deposit("1000.00", txn_id="c1"),
+            _withdraw("200.50", txn_id="c2"),
+        ])
         summary = portfolio_service.get_summary(account_names=None)
         assert summary["cash_balance"] == 799.50
         assert summary["positions"] == []
@@ -82,78 +187,14 @@ class TestPortfolioCashOnly:
 class TestPortfolioPositionsOnly:
     """BUY/SELL drive positions and cash impact."""
 
-    def test_single_buy_position(
-        self, portfolio_service, account_for_transactions
-    ):
-        txn_svc = portfolio_service._txn_svc
-        # BUY 10 @ 150.50 + 0 fees -> cash -1505.00, position AAPL 10
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("150.50"),
-                fees=Decimal("0"),
-                txn_id="b1",
-            )
-        )
-        summary = portfolio_service.get_summary(account_names=None)
-        assert summary["cash_balance"] == -1505.00  # no deposit, so negative
-        assert len(summary["positions"]) == 1
-        assert summary["positions"][0]["symbol"] == "AAPL"
-        assert summary["positions"][0]["quantity"] == 10.0
-        # total_cost = 10 * 150.50 = 1505.00
-        assert summary["positions"][0]["total_cost"] == 1505.00
-
-    def test_buy_with_fees(
-        self, portfolio_service, account_for_transactions
-    ):
-        txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="MSFT",
-                quantity=Decimal("5"),
-                price=Decimal("200"),
-                fees=Decimal("2.50"),
-                txn_id="b2",
-            )
-        )
-        summary = portfolio_service.get_summary(account_names=None)
-        assert summary["cash_balance"] == -1002.50  # -(5*200 + 2.50)
-        assert len(summary["positions"]) == 1
-        assert summary["positions"][0]["symbol"] == "MSFT"
-        assert summary["positions"][0]["quantity"] == 5.0
-        assert summary["positions"][0]["total_cost"] == 1002.50  # 1000 + 2.50
-
     def test_buy_and_sell_partial(
         self, portfolio_service, account_for_transactions
     ):
         txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="GOOG",
-                quantity=Decimal("20"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
-                txn_id="b3",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.SELL,
-                symbol="goog",  # lowercase to test normalization
-                quantity=Decimal("8"),
-                price=Decimal("105"),
-                fees=Decimal("1"),
-                txn_id="s1",
-            )
-        )
+        txn_svc.create_batch_transaction([
+            _buy("GOOG", 20, 100, txn_id="b3"),
+            _sell("goog", 8, 105, 1, txn_id="s1"),  # lowercase to test normalization
+        ])
         summary = portfolio_service.get_summary(account_names=None)
         # Cash: -20*100 + (8*105 - 1) = -2000 + 839 = -1161
         assert summary["cash_balance"] == -1161.00
@@ -166,27 +207,10 @@ class TestPortfolioPositionsOnly:
     def test_sell_all_excludes_position(
         self, portfolio_service, account_for_transactions
     ):
-        txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
-                txn_id="b4",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.SELL,
-                symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("110"),
-                txn_id="s2",
-            )
-        )
+        portfolio_service._txn_svc.create_batch_transaction([
+            _buy("AAPL", 10, 100),
+            _sell("AAPL", 10, 110),
+        ])
         summary = portfolio_service.get_summary(account_names=None)
         assert summary["positions"] == []  # quantity 0 excluded
 
@@ -198,25 +222,10 @@ class TestPortfolioMixed:
         self, portfolio_service, account_for_transactions
     ):
         txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("5000"),
-                txn_id="d1",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("150.50"),
-                fees=Decimal("5"),
-                txn_id="b5",
-            )
-        )
+        txn_svc.create_batch_transaction([
+            _deposit(5000, txn_id="d1"),
+            _buy("AAPL", 10, "150.50", 5, txn_id="b5"),
+        ])
         summary = portfolio_service.get_summary(account_names=None)
         assert summary["cash_balance"] == 5000 - 1505 - 5  # 3489.50
         assert len(summary["positions"]) == 1
@@ -229,49 +238,17 @@ class TestPortfolioMultipleAccounts:
     """Multiple accounts selected -> merged cash and positions."""
 
     def test_merged_cash_and_positions(
-        self, portfolio_service, account_service, account_for_transactions
+        self, portfolio_service, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="BrokerA"))
-        account_service.save_account(AccountCreate(name="BrokerB"))
         txn_svc = portfolio_service._txn_svc
         # Account 1: deposit 1000, buy AAPL 5
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
-                txn_id="m1",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("5"),
-                price=Decimal("100"),
-                txn_id="m2",
-            )
-        )
-        # Account 2: deposit 500, buy AAPL 3 (same symbol -> merged)
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name="BrokerA",
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("500"),
-                txn_id="m3",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name="BrokerA",
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("3"),
-                price=Decimal("100"),
-                txn_id="m4",
-            )
-        )
+        txn_svc.create_batch_transaction([
+            _deposit(1000, txn_id="m1"),
+            _buy("AAPL", 5, 100, txn_id="m2"),
+            # Account 2: deposit 500, buy AAPL 3 (same symbol -> merged)
+            _deposit(500, account_name="BrokerA", txn_id="m3"),
+            _buy("AAPL", 3, 100, account_name="BrokerA", txn_id="m4"),
+        ])
         # All accounts
         summary_all = portfolio_service.get_summary(account_names=None)
         assert summary_all["cash_balance"] == 1000 - 500 + 500 - 300  # 700
@@ -299,60 +276,12 @@ class TestPortfolioAccountFilter:
         self, portfolio_service, account_for_transactions
     ):
         txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("100"),
-                txn_id="e1",
-            )
-        )
+        txn_svc.create_transaction(_deposit(100, txn_id="e1"))
         summary_none = portfolio_service.get_summary(account_names=None)
         summary_empty = portfolio_service.get_summary(account_names=[])
+        assert summary_empty == summary_none
         assert summary_none["cash_balance"] == 100.0
-        assert summary_empty["cash_balance"] == 100.0
-        assert summary_none["positions"] == summary_empty["positions"] == []
-
-
-class TestPortfolioSymbolNormalization:
-    """Symbols are stripped and uppercased; empty/null excluded from positions."""
-
-    def test_symbol_uppercase(
-        self, portfolio_service, account_for_transactions
-    ):
-        txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="  aapl  ",
-                quantity=Decimal("1"),
-                price=Decimal("100"),
-                txn_id="n1",
-            )
-        )
-        summary = portfolio_service.get_summary(account_names=None)
-        assert len(summary["positions"]) == 1
-        assert summary["positions"][0]["symbol"] == "AAPL"
-
-
-class TestPortfolioRounding:
-    """Cash and total_cost 2 decimals; quantity up to 4 decimals."""
-
-    def test_cash_two_decimals(
-        self, portfolio_service, account_for_transactions
-    ):
-        txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("123.456"),
-                txn_id="r1",
-            )
-        )
-        summary = portfolio_service.get_summary(account_names=None)
-        assert summary["cash_balance"] == 123.46
+        assert summary_none["positions"] == []
 
 
 class TestPortfolioGetQuantityHeld:
@@ -365,42 +294,16 @@ class TestPortfolioGetQuantityHeld:
     def test_returns_quantity_after_buy(
         self, portfolio_service, account_for_transactions
     ):
-        portfolio_service._txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("15"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
-                txn_id="qh1",
-            )
-        )
+        portfolio_service._txn_svc.create_transaction(_buy("AAPL", 15, 100, txn_id="qh1"))
         assert portfolio_service.get_quantity_held(account_for_transactions, "AAPL") == 15
 
     def test_returns_remaining_after_sell(
         self, portfolio_service, account_for_transactions
     ):
-        portfolio_service._txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="MSFT",
-                quantity=Decimal("20"),
-                price=Decimal("200"),
-                txn_id="qh2b",
-            )
-        )
-        portfolio_service._txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.SELL,
-                symbol="MSFT",
-                quantity=Decimal("7"),
-                price=Decimal("210"),
-                txn_id="qh2s",
-            )
-        )
+        portfolio_service._txn_svc.create_batch_transaction([
+            _buy("MSFT", 20, 200),
+            _sell("MSFT", 7, 210),
+        ])
         assert portfolio_service.get_quantity_held(account_for_transactions, "MSFT") == 13
 
 
@@ -413,57 +316,21 @@ class TestPortfolioGetPositionsBySymbol:
     def test_single_account(
         self, portfolio_service, account_for_transactions
     ):
-        portfolio_service._txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="GOOG",
-                quantity=Decimal("10"),
-                price=Decimal("140"),
-                txn_id="pb1",
-            )
-        )
+        portfolio_service._txn_svc.create_transaction(_buy("GOOG", 10, 140, txn_id="pb1"))
         positions = portfolio_service.get_positions_by_symbol("GOOG")
         assert len(positions) == 1
         assert positions[0]["account_name"] == account_for_transactions
         assert positions[0]["quantity"] == 10.0
 
     def test_multiple_accounts_sorted_by_quantity_desc(
-        self, portfolio_service, account_service, account_for_transactions
+        self, portfolio_service, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="BrokerA"))
-        account_service.save_account(AccountCreate(name="BrokerB"))
         txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="XYZ",
-                quantity=Decimal("5"),
-                price=Decimal("10"),
-                txn_id="pb2a",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name="BrokerA",
-                txn_type=TransactionType.BUY,
-                symbol="XYZ",
-                quantity=Decimal("50"),
-                price=Decimal("10"),
-                txn_id="pb2b",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name="BrokerB",
-                txn_type=TransactionType.BUY,
-                symbol="XYZ",
-                quantity=Decimal("25"),
-                price=Decimal("10"),
-                txn_id="pb2c",
-            )
-        )
+        txn_svc.create_batch_transaction([
+            _buy("XYZ", 5, 10, txn_id="pb2a"),
+            _buy("XYZ", 50, 10, account_name="BrokerA", txn_id="pb2b"),
+            _buy("XYZ", 25, 10, account_name="BrokerB", txn_id="pb2c"),
+        ])
         positions = portfolio_service.get_positions_by_symbol("XYZ")
         assert len(positions) == 3
         assert positions[0]["account_name"] == "BrokerA" and positions[0]["quantity"] == 50.0
@@ -477,36 +344,11 @@ class TestPortfolioSellCashDestination:
     def test_sell_without_cash_dest_credits_source(
         self, portfolio_service, account_for_transactions
     ):
-        txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("5000"),
-                txn_id="cd1",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
-                txn_id="cd2",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.SELL,
-                symbol="AAPL",
-                quantity=Decimal("5"),
-                price=Decimal("110"),
-                txn_id="cd3",
-                cash_destination_account=None,
-            )
-        )
+        portfolio_service._txn_svc.create_batch_transaction([
+            _deposit(5000),
+            _buy("AAPL", 10, 100),
+            _sell("AAPL", 5, 110, cash_destination_account=None),
+        ])
         summary = portfolio_service.get_summary(account_names=None)
         # Cash: 5000 - 1000 (buy) + (5*110) (sell) = 5000 - 1000 + 550 = 4550
         assert summary["cash_balance"] == 4550.0
@@ -514,47 +356,15 @@ class TestPortfolioSellCashDestination:
         assert ac[account_for_transactions] == 4550.0
 
     def test_sell_with_cash_dest_credits_dest_account(
-        self, portfolio_service, account_service, account_for_transactions
+        self, portfolio_service, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="Savings"))
         txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("3000"),
-                txn_id="cd4a",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name="Savings",
-                txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("1000"),
-                txn_id="cd4b",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="TSLA",
-                quantity=Decimal("4"),
-                price=Decimal("250"),
-                txn_id="cd4c",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.SELL,
-                symbol="TSLA",
-                quantity=Decimal("2"),
-                price=Decimal("260"),
-                txn_id="cd4d",
-                cash_destination_account="Savings",
-            )
-        )
+        txn_svc.create_batch_transaction([
+            _deposit(3000, txn_id="cd4a"),
+            _deposit(1000, account_name="Savings", txn_id="cd4b"),
+            _buy("TSLA", 4, 250, txn_id="cd4c"),
+            _sell("TSLA", 2, 260, txn_id="cd4d", cash_destination_account="Savings"),
+        ])
         summary = portfolio_service.get_summary(account_names=None)
         # TestBroker: 3000 - 1000 (buy) = 2000; Savings: 1000 + (2*260) = 1520
         ac = {a["account_name"]: a["cash_balance"] for a in summary["account_cash"]}
@@ -568,17 +378,7 @@ class TestPortfolioQuotesDisabled:
     def test_quotes_disabled_returns_cost_price_no_quote_fields(
         self, portfolio_service, account_for_transactions
     ):
-        portfolio_service._txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
-                txn_id="q0",
-            )
-        )
+        portfolio_service._txn_svc.create_transaction(_buy("AAPL", 10, 100, txn_id="q0"))
         summary = portfolio_service.get_summary(
             account_names=None, include_quotes=False
         )
@@ -593,27 +393,41 @@ class TestPortfolioQuotesDisabled:
         assert "display_name" not in p
 
 
+class _FixedQuoteService:
+    """Quote stub backed by one read-only table; callers only read the returned entries."""
+
+    _QUOTES = MappingProxyType({
+        "AAPL": MappingProxyType({
+            "current_price": 150.0,
+            "display_name": "Apple Inc.",
+            "previous_close": 148.0,
+        }),
+        "MSFT": MappingProxyType({
+            "current_price": 400.0,
+            "display_name": "Microsoft Corporation",
+            "previous_close": 398.5,
+        }),
+    })
+
+    def get_quotes(self, symbols):
+        quotes = self._QUOTES
+        return {s: quotes[s] for s in symbols if s in quotes}
+
+
+class _NoQuoteService:
+    """Quote stub that reports every symbol as unpriced (display_name falls back to the symbol)."""
+
+    def get_quotes(self, symbols):
+        return {s: {"current_price": None, "display_name": s, "previous_close": None} for s in symbols}
+
+
 class TestPortfolioQuotesEnriched:
     """When include_quotes=True and quote_service returns data, positions have computed fields."""
 
     @pytest.fixture
     def mock_quote_service(self):
         """Returns fixed price, name, and previous_close per symbol."""
-        class MockQuoteService:
-            def get_quotes(self, symbols):
-                return {
-                    "AAPL": {
-                        "current_price": 150.0,
-                        "display_name": "Apple Inc.",
-                        "previous_close": 148.0,
-                    },
-                    "MSFT": {
-                        "current_price": 400.0,
-                        "display_name": "Microsoft Corporation",
-                        "previous_close": 398.5,
-                    },
-                }
-        return MockQuoteService()
+        return _FixedQuoteService()
 
     @pytest.fixture
     def portfolio_service_with_quotes(self, transaction_service, mock_quote_service):
@@ -625,34 +439,15 @@ class TestPortfolioQuotesEnriched:
     def test_enriched_positions_have_market_value_pnl_weight(
         self, portfolio_service_with_quotes, account_for_transactions
     ):
-        txn_svc = portfolio_service_with_quotes._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
-                txn_id="e1",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="MSFT",
-                quantity=Decimal("5"),
-                price=Decimal("350"),
-                fees=Decimal("0"),
-                txn_id="e2",
-            )
-        )
+        portfolio_service_with_quotes._txn_svc.create_batch_transaction([
+            _buy("AAPL", 10, 100),
+            _buy("MSFT", 5, 350),
+        ])
         summary = portfolio_service_with_quotes.get_summary(
             account_names=None, include_quotes=True
         )
-        assert len(summary["positions"]) == 2
         by_sym = {p["symbol"]: p for p in summary["positions"]}
+        assert by_sym.keys() == {"AAPL", "MSFT"}
         # AAPL: cost 1000, latest 150 -> market 1500, pnl 500, pnl_pct 50%
         aapl = by_sym["AAPL"]
         assert aapl["cost_price"] == 100.0
@@ -677,29 +472,10 @@ class TestPortfolioQuotesEnriched:
     ):
         """休市日若 Yahoo 返回的 current_price 与 previous_close 不一致，当日盈亏会非零（如 -15）。
         本测试用 mock 模拟该情况：current < previous_close 时，当日盈亏为负。"""
-        txn_svc = portfolio_service_with_quotes._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
-                fees=Decimal("0"),
-                txn_id="e1",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="MSFT",
-                quantity=Decimal("10"),
-                price=Decimal("350"),
-                fees=Decimal("0"),
-                txn_id="e2",
-            )
-        )
+        portfolio_service_with_quotes._txn_svc.create_batch_transaction([
+            _buy("AAPL", 10, 100),
+            _buy("MSFT", 10, 350),
+        ])
         summary = portfolio_service_with_quotes.get_summary(
             account_names=None, include_quotes=True
         )
@@ -709,37 +485,23 @@ class TestPortfolioQuotesEnriched:
         # 若改为 latest 略低于 previous（模拟休市日 Yahoo 数据不一致）：
         # 例如 AAPL latest=147.5, previous=148 -> (147.5-148)*10 = -5
         #     MSFT latest=398, previous=398.5 -> (398-398.5)*10 = -5 -> 合计 -10
-        aapl = by_sym["AAPL"]
-        msft = by_sym["MSFT"]
-        today_pnl_actual = (
-            (aapl["latest_price"] - aapl["previous_close"]) * aapl["quantity"]
-            + (msft["latest_price"] - msft["previous_close"]) * msft["quantity"]
+        today_pnl_actual = sum(
+            (p["latest_price"] - p["previous_close"]) * p["quantity"] for p in by_sym.values()
         )
         assert today_pnl_actual == 35.0  # 当前 mock 是 150/148 和 400/398.5，所以为正
         # 断言：只要 latest_price != previous_close，当日盈亏公式就会非零
-        assert aapl["latest_price"] != aapl["previous_close"]
-        assert msft["latest_price"] != msft["previous_close"]
+        assert by_sym.keys() == {"AAPL", "MSFT"}
+        for p in by_sym.values():
+            assert p["latest_price"] != p["previous_close"]
 
     def test_missing_quote_yields_none_for_derived_fields(
         self, transaction_service, account_for_transactions
     ):
-        class NoQuoteService:
-            def get_quotes(self, symbols):
-                return {s: {"current_price": None, "display_name": s, "previous_close": None} for s in symbols}
         svc = PortfolioService(
             transaction_service=transaction_service,
-            quote_service=NoQuoteService(),
-        )
-        svc._txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="AAPL",
-                quantity=Decimal("5"),
-                price=Decimal("100"),
-                txn_id="e3",
-            )
+            quote_service=_NoQuoteService(),
         )
+        svc._txn_svc.create_transaction(_buy("AAPL", 5, 100, txn_id="e3"))
         summary = svc.get_summary(account_names=None, include_quotes=True)
         assert len(summary["positions"]) == 1
         p = summary["positions"][0]
@@ -758,63 +520,84 @@ class TestPortfolioQuotesEnriched:
 # -----------------------------------------------------------------------------
 
 
-@pytest.fixture
-def client():
-    return TestClient(app)
+# Query-string variants of GET /portfolio exercised by the read-only shape tests.
+_PORTFOLIO_QUERIES = {
+    "default": {},
+    "quotes_zero": {"quotes": "0"},
+    "quotes_one": {"quotes": "1"},
+    "account": {"account": ["SomeAccount"]},
+}
+
+
+@pytest.fixture(scope="module")
+def portfolio_responses(client, _app_config):
+    """One GET /portfolio per query variant, shared by every shape test in the module.
+    Module-scoped fixtures run before the per-test _reset_app_db, so the app DB is emptied here first."""
+    clear_app_db(_app_config)
+    return {variant: client.get("/portfolio", params=params) for variant, params in _PORTFOLIO_QUERIES.items()}
+
+
+@pytest.fixture(scope="module")
+def portfolio_bodies(portfolio_responses):
+    """Decoded JSON of each shared /portfolio response, parsed once for the module."""
+    return {variant: r.json() for variant, r in portfolio_responses.items()}
+
+
+# Required keys of the GET /portfolio body, checked as set inclusion rather than per-key asserts.
+_PORTFOLIO_KEYS = frozenset({"cash_balance", "account_cash", "positions"})
+_ACCOUNT_CASH_KEYS = frozenset({"account_name", "cash_balance"})
+_POSITION_KEYS = frozenset({"symbol", "quantity", "total_cost"})
+
+
+def _assert_portfolio_shape(data):
+    assert _PORTFOLIO_KEYS <= data.keys()
+    assert isinstance(data["cash_balance"], (int, float))
+    assert isinstance(data["account_cash"], list)
+    assert isinstance(data["positions"], list)
+    assert all(_ACCOUNT_CASH_KEYS <= ac.keys() for ac in data["account_cash"])
+    assert all(_POSITION_KEYS <= pos.keys() for pos in data["positions"])
 
 
 class TestPortfolioAPI:
     """GET /portfolio endpoint."""
 
-    def test_get_portfolio_no_param_returns_200(self, client):
-        r = client.get("/portfolio")
-        assert r.status_code == 200
-        data = r.json()
+    @pytest.mark.parametrize("variant", list(_PORTFOLIO_QUERIES))
+    def test_get_portfolio_returns_200(self, portfolio_responses, variant):
+        assert portfolio_responses[variant].status_code == 200
+
+    def test_get_portfolio_no_param_has_cash_and_positions(self, portfolio_bodies):
+        data = portfolio_bodies["default"]
         assert "cash_balance" in data
         assert "positions" in data
         assert isinstance(data["positions"], list)
 
-    def test_get_portfolio_with_account_param(self, client):
-        r = client.get("/portfolio", params={"account": ["SomeAccount"]})
-        assert r.status_code == 200
-        data = r.json()
+    def test_get_portfolio_with_account_param(self, portfolio_bodies):
+        data = portfolio_bodies["account"]
         assert data["cash_balance"] == 0.0
         assert data["positions"] == []
 
-    def test_get_portfolio_response_shape(self, client):
-        r = client.get("/portfolio")
-        assert r.status_code == 200
-        data = r.json()
-        assert isinstance(data["cash_balance"], (int, float))
-        assert "account_cash" in data
-        assert isinstance(data["account_cash"], list)
-        for ac in data["account_cash"]:
-            assert "account_name" in ac
-            assert "cash_balance" in ac
-        for pos in data["positions"]:
-            assert "symbol" in pos
-            assert "quantity" in pos
-            assert "total_cost" in pos
+    def test_get_portfolio_response_shape(self, portfolio_bodies):
+        _assert_portfolio_shape(portfolio_bodies["default"])
 
-    def test_get_portfolio_quotes_zero_returns_positions_with_cost_price(self, client):
-        r = client.get("/portfolio", params={"quotes": "0"})
-        assert r.status_code == 200
-        data = r.json()
+    def test_get_portfolio_quotes_zero_returns_positions_with_cost_price(self, portfolio_bodies):
+        data = portfolio_bodies["quotes_zero"]
         # When no positions, list is empty; when positions exist they have cost_price
         assert "positions" in data
         for pos in data["positions"]:
             assert "cost_price" in pos
 
-    def test_get_portfolio_quotes_one_returns_enriched_shape(self, client):
-        r = client.get("/portfolio", params={"quotes": "1"})
-        assert r.status_code == 200
-        data = r.json()
-        for pos in data["positions"]:
-            assert "symbol" in pos
-            assert "quantity" in pos
-            assert "total_cost" in pos
-            # Optional fields may be present when quotes enabled
-            assert "cost_price" in pos or "display_name" in pos or True  # structure allows optional
+    def test_get_portfolio_quotes_one_returns_enriched_shape(self, portfolio_bodies):
+        # Optional quote fields may be present when quotes are enabled; only the base shape is required
+        _assert_portfolio_shape(portfolio_bodies["quotes_one"])
+
+    def test_get_portfolio_quotes_come_from_app_quote_table(self, client, seed_app):
+        """The session app serves quotes from conftest's fixed table: AAPL is 200 (previous close 198)."""
+        seed_app(accounts=["QuoteAcct"], transactions=[_buy("AAPL", 2, 150, account_name="QuoteAcct")])
+        (pos,) = client.get("/portfolio").json()["positions"]
+        assert pos["symbol"] == "AAPL"
+        assert pos["latest_price"] == 200.0
+        assert pos["previous_close"] == 198.0
+        assert pos["market_value"] == 400.0
 
     def test_get_positions_by_symbol_returns_structure(self, client):
         """GET /portfolio/positions-by-symbol returns symbol and positions list."""
@@ -836,85 +619,63 @@ class TestPortfolioAPI:
 class TestNormalizeSymbol:
     """normalize_symbol: shared utility used across services."""
 
-    def test_none_returns_none(self):
-        from src.service.util import normalize_symbol
-        assert normalize_symbol(None) is None
-
-    def test_empty_string_returns_none(self):
-        from src.service.util import normalize_symbol
-        assert normalize_symbol("") is None
-
-    def test_whitespace_only_returns_none(self):
-        from src.service.util import normalize_symbol
-        assert normalize_symbol("   ") is None
-
-    def test_strips_and_uppercases(self):
-        from src.service.util import normalize_symbol
-        assert normalize_symbol("  aapl  ") == "AAPL"
-
-    def test_already_uppercase(self):
-        from src.service.util import normalize_symbol
-        assert normalize_symbol("MSFT") == "MSFT"
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            (None, None),
+            ("", None),
+            ("   ", None),
+            ("  aapl  ", "AAPL"),
+            ("MSFT", "MSFT"),
+        ],
+        ids=["none", "empty", "whitespace_only", "strips_and_uppercases", "already_uppercase"],
+    )
+    def test_normalize_symbol(self, raw, expected):
+        assert normalize_symbol(raw) == expected
 
 
 class TestRound2:
     """round2: shared utility for monetary rounding."""
 
-    def test_rounds_to_two_decimals(self):
-        from src.service.util import round2
-        assert round2(123.456) == 123.46
-        assert round2(123.454) == 123.45
-
-    def test_integer_input(self):
-        from src.service.util import round2
-        assert round2(100) == 100.0
-
-    def test_string_coerced_to_float(self):
-        from src.service.util import round2
-        # round2 calls float() so Decimal or int will work too
-        from decimal import Decimal
-        assert round2(Decimal("99.999")) == 100.0
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (123.456, 123.46),
+            (123.454, 123.45),
+            (100, 100.0),  # integer input
+            (Decimal("99.999"), 100.0),  # round2 calls float() so Decimal works too
+        ],
+        ids=["rounds_half_up", "rounds_down", "integer_input", "decimal_input"],
+    )
+    def test_round2(self, value, expected):
+        assert round2(value) == expected
+
+
+@pytest.fixture(scope="class")
+def _positions_by_symbol_data(account_service, transaction_service, account_for_transactions, brokers):
+    """Read-only transactions for TestGetPositionsBySymbolOptimized, loaded once for the class."""
+    clear_all(account_service, transaction_service, keep_accounts=(account_for_transactions, *brokers))
+    transaction_service.create_batch_transaction([
+        # EmptyAcct bought and sold all GOOG; default account still holds 5
+        _buy("GOOG", 10, 100, account_name="EmptyAcct", txn_id="opt-b1"),
+        _sell("GOOG", 10, 110, account_name="EmptyAcct", txn_id="opt-s1"),
+        _buy("GOOG", 5, 100, txn_id="opt-b2"),
+        _buy("NVDA", 3, 500, txn_id="opt-norm1"),
+    ])
 
 
 class TestGetPositionsBySymbolOptimized:
-    """Verify get_positions_by_symbol uses single-pass (behavior test, not perf)."""
+    """Verify get_positions_by_symbol uses single-pass (behavior test, not perf).
+    Tests here only read, so the transactions are loaded once for the whole class."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, _positions_by_symbol_data):
+        """Overrides the module-level per-test reset: class data stays in place between tests."""
 
     def test_accounts_with_zero_quantity_excluded(
-        self, portfolio_service, account_service, account_for_transactions
+        self, portfolio_service, account_for_transactions
     ):
         """Account that bought and sold all shares should not appear."""
-        account_service.save_account(AccountCreate(name="EmptyAcct"))
-        txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name="EmptyAcct",
-                txn_type=TransactionType.BUY,
-                symbol="GOOG",
-                quantity=Decimal("10"),
-                price=Decimal("100"),
-                txn_id="opt-b1",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name="EmptyAcct",
-                txn_type=TransactionType.SELL,
-                symbol="GOOG",
-                quantity=Decimal("10"),
-                price=Decimal("110"),
-                txn_id="opt-s1",
-            )
-        )
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="GOOG",
-                quantity=Decimal("5"),
-                price=Decimal("100"),
-                txn_id="opt-b2",
-            )
-        )
         positions = portfolio_service.get_positions_by_symbol("GOOG")
         assert len(positions) == 1
         assert positions[0]["account_name"] == account_for_transactions
@@ -924,18 +685,6 @@ class TestGetPositionsBySymbolOptimized:
         self, portfolio_service, account_for_transactions
     ):
         """Querying with lowercase symbol should still find positions."""
-        txn_svc = portfolio_service._txn_svc
-        txn_svc.create_transaction(
-            make_transaction_create(
-                account_name=account_for_transactions,
-                txn_type=TransactionType.BUY,
-                symbol="NVDA",
-                quantity=Decimal("3"),
-                price=Decimal("500"),
-                txn_id="opt-norm1",
-            )
-        )
-        # Query with lowercase
         positions = portfolio_service.get_positions_by_symbol("nvda")
         assert len(positions) == 1
         assert positions[0]["quantity"] == 3.0
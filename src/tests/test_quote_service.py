@@ -1,124 +1,50 @@
 """
 Tests for QuoteService: cache, TTL, per-symbol failure, timeout.
-Uses mocks to avoid hitting Yahoo Finance.
+Uses mocks to avoid hitting Yahoo Finance. Pure _safe_quote_for_symbol cases live in
+test_safe_quote_for_symbol.py.
 """
-import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from src.service.quote_service import (
     QuoteService,
     _fetch_quotes_impl,
-    _safe_quote_for_symbol,
     DEFAULT_TTL_SECONDS,
 )
+from src.tests.conftest import fake_ticker, fake_tickers
 
 
 # -----------------------------------------------------------------------------
-# _safe_quote_for_symbol (unit)
+# QuoteService with mocked yfinance
 # -----------------------------------------------------------------------------
 
 
-class TestSafeQuoteForSymbol:
-    """_safe_quote_for_symbol returns (price, name, previous_close) or (None, symbol, None) on error."""
-
-    def test_extracts_current_price_and_long_name(self):
-        tickers = MagicMock()
-        tickers.tickers = {
-            "AAPL": MagicMock(info={"currentPrice": 175.5, "longName": "Apple Inc."}),
-        }
-        price, name, prev_close = _safe_quote_for_symbol("AAPL", tickers)
-        assert price == 175.5
-        assert name == "Apple Inc."
-        assert prev_close is None
-
-    def test_extracts_previous_close_when_present(self):
-        tickers = MagicMock()
-        tickers.tickers = {
-            "AAPL": MagicMock(info={
-                "currentPrice": 180.0,
-                "longName": "Apple Inc.",
-                "previousClose": 175.25,
-            }),
-        }
-        price, name, prev_close = _safe_quote_for_symbol("AAPL", tickers)
-        assert price == 180.0
-        assert name == "Apple Inc."
-        assert prev_close == 175.25
-
-    def test_fallback_regular_market_previous_close(self):
-        tickers = MagicMock()
-        tickers.tickers = {
-            "X": MagicMock(info={
-                "regularMarketPrice": 22.0,
-                "regularMarketPreviousClose": 21.5,
-                "shortName": "X Corp",
-            }),
-        }
-        price, name, prev_close = _safe_quote_for_symbol("X", tickers)
-        assert price == 22.0
-        assert name == "X Corp"
-        assert prev_close == 21.5
-
-    def test_fallback_regular_market_price(self):
-        tickers = MagicMock()
-        tickers.tickers = {
-            "X": MagicMock(info={"regularMarketPrice": 22.0, "shortName": "X Corp"}),
-        }
-        price, name, prev_close = _safe_quote_for_symbol("X", tickers)
-        assert price == 22.0
-        assert name == "X Corp"
-        assert prev_close is None
-
-    def test_fallback_display_name_to_symbol(self):
-        tickers = MagicMock()
-        tickers.tickers = {
-            "Y": MagicMock(info={"currentPrice": 10.0}),  # no longName/shortName
-        }
-        price, name, prev_close = _safe_quote_for_symbol("Y", tickers)
-        assert price == 10.0
-        assert name == "Y"
-        assert prev_close is None
-
-    def test_missing_ticker_returns_none_and_symbol(self):
-        tickers = MagicMock()
-        tickers.tickers = {}
-        price, name, prev_close = _safe_quote_for_symbol("UNKNOWN", tickers)
-        assert price is None
-        assert name == "UNKNOWN"
-        assert prev_close is None
-
-    def test_exception_returns_none_and_symbol(self):
-        tickers = MagicMock()
-        tickers.tickers = {"Z": MagicMock()}
-        tickers.tickers["Z"].info = None  # will cause TypeError or similar when we .get
-        price, name, prev_close = _safe_quote_for_symbol("Z", tickers)
-        assert price is None
-        assert name == "Z"
-        assert prev_close is None
+class _RaisingTicker:
+    """Ticker whose info lookup fails, like a yfinance ticker whose quote request errors."""
 
+    @property
+    def info(self):
+        raise ValueError("quote failed")
 
-# -----------------------------------------------------------------------------
-# QuoteService with mocked yfinance
-# -----------------------------------------------------------------------------
 
+_RAISING = _RaisingTicker()
 
-@patch("src.service.quote_service._get_yf")
-def test_get_quotes_returns_price_name_and_previous_close(mock_get_yf):
-    """get_quotes calls yfinance and returns current_price, display_name, and previous_close per symbol."""
+
+@pytest.fixture
+def mocked_yf(monkeypatch):
+    """Stand-in yfinance module returned by _get_yf; set mocked_yf.Tickers.return_value per test."""
     mock_yf = MagicMock()
-    mock_tickers = MagicMock()
-    mock_tickers.tickers = {
-        "AAPL": MagicMock(info={
-            "currentPrice": 180.0,
-            "longName": "Apple Inc.",
-            "previousClose": 178.5,
-        }),
-        "MSFT": MagicMock(info={"currentPrice": 400.0, "longName": "Microsoft Corporation"}),
-    }
-    mock_yf.Tickers.return_value = mock_tickers
-    mock_get_yf.return_value = mock_yf
+    monkeypatch.setattr("src.service.quote_service._get_yf", lambda: mock_yf)
+    return mock_yf
+
+
+def test_get_quotes_returns_price_name_and_previous_close(mocked_yf):
+    """get_quotes calls yfinance and returns current_price, display_name, and previous_close per symbol."""
+    mocked_yf.Tickers.return_value = fake_tickers({
+        "AAPL": fake_ticker(currentPrice=180.0, longName="Apple Inc.", previousClose=178.5),
+        "MSFT": fake_ticker(currentPrice=400.0, longName="Microsoft Corporation"),
+    })
 
     svc = QuoteService(ttl_seconds=60, fetch_timeout_seconds=5)
     result = svc.get_quotes(["AAPL", "MSFT"])
@@ -131,18 +57,22 @@ def test_get_quotes_returns_price_name_and_previous_close(mock_get_yf):
     assert result["MSFT"]["previous_close"] is None
 
 
+def test_get_quotes_retries_once_when_no_prices(mocked_yf):
+    mocked_yf.Tickers.return_value = fake_tickers({"AAPL": fake_ticker(longName="Apple")})  # no price
+
+    svc = QuoteService(fetch_timeout_seconds=5, retry_delay_seconds=0)
+    result = svc.get_quotes(["AAPL"])
+    assert result["AAPL"]["current_price"] is None
+    assert mocked_yf.Tickers.call_count == 2
+
+
 def test_get_quotes_empty_list_returns_empty():
     svc = QuoteService()
     assert svc.get_quotes([]) == {}
 
 
-@patch("src.service.quote_service._get_yf")
-def test_get_quotes_cache_hit_does_not_call_yfinance(mock_get_yf):
-    mock_yf = MagicMock()
-    mock_tickers = MagicMock()
-    mock_tickers.tickers = {"AAPL": MagicMock(info={"currentPrice": 100.0, "longName": "Apple"})}
-    mock_yf.Tickers.return_value = mock_tickers
-    mock_get_yf.return_value = mock_yf
+def test_get_quotes_cache_hit_does_not_call_yfinance(mocked_yf):
+    mocked_yf.Tickers.return_value = fake_tickers({"AAPL": fake_ticker(currentPrice=100.0, longName="Apple")})
 
     svc = QuoteService(ttl_seconds=2, fetch_timeout_seconds=5)
     first = svc.get_quotes(["AAPL"])
@@ -151,38 +81,36 @@ def test_get_quotes_cache_hit_does_not_call_yfinance(mock_get_yf):
     # Second call within TTL: cache hit, yfinance not called again (Tickers called once)
     second = svc.get_quotes(["AAPL"])
     assert second["AAPL"]["current_price"] == 100.0
-    assert mock_yf.Tickers.call_count == 1
+    assert mocked_yf.Tickers.call_count == 1
 
 
-@patch("src.service.quote_service._get_yf")
-def test_get_quotes_cache_expires_after_ttl(mock_get_yf):
-    mock_yf = MagicMock()
-    mock_tickers = MagicMock()
-    mock_tickers.tickers = {"AAPL": MagicMock(info={"currentPrice": 99.0, "longName": "Apple"})}
-    mock_yf.Tickers.return_value = mock_tickers
-    mock_get_yf.return_value = mock_yf
+def test_get_quotes_cache_expires_after_ttl(mocked_yf):
+    mocked_yf.Tickers.return_value = fake_tickers({"AAPL": fake_ticker(currentPrice=99.0, longName="Apple")})
 
-    svc = QuoteService(ttl_seconds=0.1, fetch_timeout_seconds=5)  # 100ms TTL
+    now = [0.0]
+    svc = QuoteService(ttl_seconds=0.1, fetch_timeout_seconds=5, clock=lambda: now[0])  # 100ms TTL
     svc.get_quotes(["AAPL"])
-    time.sleep(0.15)
+    now[0] = 1.0  # advance past the TTL without sleeping
     svc.get_quotes(["AAPL"])
     # Tickers should be called twice (first fetch, then after TTL expiry)
-    assert mock_yf.Tickers.call_count == 2
+    assert mocked_yf.Tickers.call_count == 2
+
+
+def test_expire_all_forces_refetch(mocked_yf):
+    mocked_yf.Tickers.return_value = fake_tickers({"AAPL": fake_ticker(currentPrice=99.0, longName="Apple")})
+
+    svc = QuoteService(ttl_seconds=60, fetch_timeout_seconds=5)
+    svc.get_quotes(["AAPL"])
+    svc._expire_all()
+    svc.get_quotes(["AAPL"])
+    assert mocked_yf.Tickers.call_count == 2
 
 
-@patch("src.service.quote_service._get_yf")
-def test_get_quotes_failure_returns_none_price_and_symbol_as_name(mock_get_yf):
+def test_get_quotes_failure_returns_none_price_and_symbol_as_name(mocked_yf):
     """One symbol raises when accessed; that symbol gets current_price=None, display_name=symbol, previous_close=None."""
-    bad_ticker = MagicMock()
-    type(bad_ticker).info = property(lambda s: (_ for _ in ()).throw(ValueError("quote failed")))
-    mock_yf = MagicMock()
-    mock_tickers = MagicMock()
-    mock_tickers.tickers = {
-        "GOOD": MagicMock(info={"currentPrice": 50.0, "longName": "Good Inc."}),
-        "BAD": bad_ticker,
-    }
-    mock_yf.Tickers.return_value = mock_tickers
-    mock_get_yf.return_value = mock_yf
+    mock_tickers = fake_tickers({"GOOD": fake_ticker(currentPrice=50.0, longName="Good Inc.")})
+    mock_tickers.tickers["BAD"] = _RAISING
+    mocked_yf.Tickers.return_value = mock_tickers
 
     svc = QuoteService(fetch_timeout_seconds=5)
     result = svc.get_quotes(["GOOD", "BAD"])
@@ -195,12 +123,14 @@ def test_get_quotes_failure_returns_none_price_and_symbol_as_name(mock_get_yf):
     assert result["BAD"]["previous_close"] is None
 
 
-@patch("src.service.quote_service._get_yf")
-def test_get_quotes_exception_during_fetch_returns_none_and_symbol(mock_get_yf):
+def test_get_quotes_exception_during_fetch_returns_none_and_symbol(monkeypatch):
     """When fetch raises (e.g. timeout), get_quotes returns current_price=None, display_name=symbol, previous_close=None."""
-    mock_get_yf.side_effect = Exception("network or timeout")
+    def _raise():
+        raise Exception("network or timeout")
 
-    svc = QuoteService(fetch_timeout_seconds=5)
+    monkeypatch.setattr("src.service.quote_service._get_yf", _raise)
+
+    svc = QuoteService(fetch_timeout_seconds=5, retry_delay_seconds=0)  # both attempts fail; skip the pause
     result = svc.get_quotes(["AAPL", "MSFT"])
 
     assert result["AAPL"]["current_price"] is None
@@ -0,0 +1,50 @@
+"""
+Tests for _safe_quote_for_symbol: pure parsing of a yfinance ticker's info dict.
+Stateless (no QuoteService, no patching), kept apart from the cache tests in test_quote_service.py.
+"""
+import pytest
+
+from src.service.quote_service import _safe_quote_for_symbol
+from src.tests.conftest import fake_tickers
+
+
+_NO_TICKER = object()  # sentinel: symbol absent from tickers_obj.tickers
+
+_SAFE_QUOTE_CASES = [
+    pytest.param(
+        "AAPL", {"currentPrice": 175.5, "longName": "Apple Inc."},
+        (175.5, "Apple Inc.", None),
+        id="current_price_and_long_name",
+    ),
+    pytest.param(
+        "AAPL", {"currentPrice": 180.0, "longName": "Apple Inc.", "previousClose": 175.25},
+        (180.0, "Apple Inc.", 175.25),
+        id="previous_close_when_present",
+    ),
+    pytest.param(
+        "X", {"regularMarketPrice": 22.0, "regularMarketPreviousClose": 21.5, "shortName": "X Corp"},
+        (22.0, "X Corp", 21.5),
+        id="fallback_regular_market_previous_close",
+    ),
+    pytest.param(
+        "X", {"regularMarketPrice": 22.0, "shortName": "X Corp"},
+        (22.0, "X Corp", None),
+        id="fallback_regular_market_price",
+    ),
+    pytest.param(
+        "Y", {"currentPrice": 10.0},  # no longName/shortName
+        (10.0, "Y", None),
+        id="fallback_display_name_to_symbol",
+    ),
+    pytest.param("UNKNOWN", _NO_TICKER, (None, "UNKNOWN", None), id="missing_ticker"),
+    pytest.param("Z", None, (None, "Z", None), id="non_dict_info"),
+]
+
+
+class TestSafeQuoteForSymbol:
+    """_safe_quote_for_symbol returns (price, name, previous_close) or (None, symbol, None) on error."""
+
+    @pytest.mark.parametrize("sym, info, expected", _SAFE_QUOTE_CASES)
+    def test_safe_quote(self, sym, info, expected):
+        tickers = fake_tickers({} if info is _NO_TICKER else {sym: info})
+        assert _safe_quote_for_symbol(sym, tickers) == expected
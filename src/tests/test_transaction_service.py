@@ -2,17 +2,16 @@
 Tests for TransactionService.
 Covers every public and validation path: common and edge cases.
 """
-from datetime import datetime
+from dataclasses import replace
 from decimal import Decimal
+import re
 
 import pytest
 
 from src.service.transaction_service import (
     TransactionService,
-    TransactionCreate,
     TransactionEdit,
 )
-from src.service.account_service import AccountCreate
 from src.service.enums import TransactionType
 from src.utils.exceptions import ValidationError, NotFoundError
 
@@ -47,209 +46,122 @@ class TestTransactionValidateAccount:
     ):
         # No account in DB
         txn = make_transaction_create(account_name="NonExistentAccount")
-        with pytest.raises(NotFoundError) as exc_info:
+        with pytest.raises(NotFoundError, match=r"Account not found: NonExistentAccount"):
             transaction_service.create_transaction(txn)
-        assert "Account" in exc_info.value.message or "not found" in exc_info.value.message.lower()
-        assert "NonExistentAccount" in exc_info.value.message
 
 
 # -----------------------------------------------------------------------------
 # _validate_transaction_create: BUY / SELL
 # -----------------------------------------------------------------------------
 
-class TestValidateTransactionCreateBuySell:
-    """Validation for BUY and SELL: symbol, quantity, price, fees, txn_time_est."""
+_INVALID_BUY_SELL_CASES = [
+    pytest.param(TransactionType.BUY, {"symbol": None}, "symbol", id="buy_missing_symbol"),
+    pytest.param(TransactionType.BUY, {"quantity": Decimal("0")}, "quantity", id="buy_quantity_zero"),
+    pytest.param(TransactionType.BUY, {"quantity": Decimal("-1")}, "quantity", id="buy_quantity_negative"),
+    pytest.param(TransactionType.BUY, {"price": Decimal("-0.01")}, "price", id="buy_price_negative"),
+    pytest.param(TransactionType.BUY, {"fees": Decimal("-1")}, "fee", id="buy_fees_negative"),
+    pytest.param(TransactionType.SELL, {"symbol": None}, "symbol", id="sell_missing_symbol"),
+]
 
-    def test_buy_missing_symbol_raises(self, transaction_service, account_for_transactions):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.BUY,
-            symbol=None,
-        )
-        with pytest.raises(ValidationError) as exc_info:
-            transaction_service.create_transaction(txn)
-        assert "symbol" in exc_info.value.message.lower()
+_VALID_BUY_SELL_CASES = [
+    pytest.param(TransactionType.BUY, "AAPL", 10, "150.00", "1.50", id="buy"),
+    pytest.param(TransactionType.SELL, "MSFT", 5, "400.00", None, id="sell"),
+]
 
-    def test_buy_quantity_zero_raises(self, transaction_service, account_for_transactions):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.BUY,
-            quantity=Decimal("0"),
-        )
-        with pytest.raises(ValidationError) as exc_info:
-            transaction_service.create_transaction(txn)
-        assert "quantity" in exc_info.value.message.lower()
-
-    def test_buy_quantity_negative_raises(self, transaction_service, account_for_transactions):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.BUY,
-            quantity=Decimal("-1"),
-        )
-        with pytest.raises(ValidationError):
-            transaction_service.create_transaction(txn)
 
-    def test_buy_price_negative_raises(self, transaction_service, account_for_transactions):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.BUY,
-            price=Decimal("-0.01"),
-        )
-        with pytest.raises(ValidationError) as exc_info:
-            transaction_service.create_transaction(txn)
-        assert "price" in exc_info.value.message.lower()
+class TestValidateTransactionCreateBuySell:
+    """Validation for BUY and SELL: symbol, quantity, price, fees, txn_time_est."""
 
-    def test_buy_fees_negative_raises(self, transaction_service, account_for_transactions):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.BUY,
-            fees=Decimal("-1"),
+    @pytest.mark.parametrize("txn_type, overrides, msg_substr", _INVALID_BUY_SELL_CASES)
+    def test_invalid_raises(
+        self, transaction_service, account_for_transactions, txn_type, overrides, msg_substr
+    ):
+        txn = replace(
+            make_transaction_create(account_name=account_for_transactions, txn_type=txn_type),
+            **overrides,
         )
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=f"(?i){msg_substr}"):
             transaction_service.create_transaction(txn)
-        assert "fee" in exc_info.value.message.lower()
 
-    def test_buy_valid_succeeds(self, transaction_service, account_for_transactions):
+    @pytest.mark.parametrize("txn_type, symbol, quantity, price, fees", _VALID_BUY_SELL_CASES)
+    def test_valid_succeeds(
+        self, transaction_service, account_for_transactions, txn_type, symbol, quantity, price, fees
+    ):
         txn = make_transaction_create(
             account_name=account_for_transactions,
-            txn_type=TransactionType.BUY,
-            symbol="AAPL",
-            quantity=Decimal("10"),
-            price=Decimal("150.00"),
-            fees=Decimal("1.50"),
-            txn_id="buy-1",
+            txn_type=txn_type,
+            symbol=symbol,
+            quantity=quantity,
+            price=price,
+            fees=fees,
+            txn_id="valid-1",
         )
         transaction_service.create_transaction(txn)
-        out = transaction_service.get_transaction("buy-1")
-        assert out["txn_type"] == "BUY"
-        assert out["symbol"] == "AAPL"
+        out = transaction_service.get_transaction("valid-1")
+        assert out["txn_type"] == txn_type.value
+        assert out["symbol"] == symbol
 
     def test_buy_symbol_normalized_to_uppercase(self, transaction_service, account_for_transactions):
         txn = make_transaction_create(
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="aapl",
-            quantity=Decimal("10"),
-            price=Decimal("150.00"),
+            quantity=10,
+            price="150.00",
             txn_id="sym-norm-1",
         )
         transaction_service.create_transaction(txn)
         out = transaction_service.get_transaction("sym-norm-1")
         assert out["symbol"] == "AAPL"
 
-    def test_sell_missing_symbol_raises(self, transaction_service, account_for_transactions):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.SELL,
-            symbol=None,
-        )
-        with pytest.raises(ValidationError) as exc_info:
-            transaction_service.create_transaction(txn)
-        assert "symbol" in exc_info.value.message.lower()
-
-    def test_sell_valid_succeeds(self, transaction_service, account_for_transactions):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.SELL,
-            symbol="MSFT",
-            quantity=Decimal("5"),
-            price=Decimal("400.00"),
-            txn_id="sell-1",
-        )
-        transaction_service.create_transaction(txn)
-        out = transaction_service.get_transaction("sell-1")
-        assert out["txn_type"] == "SELL"
-        assert out["symbol"] == "MSFT"
-
 
 # -----------------------------------------------------------------------------
 # _validate_transaction_create: CASH_DEPOSIT / CASH_WITHDRAW
 # -----------------------------------------------------------------------------
 
-class TestValidateTransactionCreateCash:
-    """Validation for CASH_DEPOSIT and CASH_WITHDRAW: cash_amount > 0."""
+_INVALID_CASH_CASES = [
+    pytest.param(TransactionType.CASH_DEPOSIT, None, id="deposit_missing_cash_amount"),
+    pytest.param(TransactionType.CASH_DEPOSIT, Decimal("0"), id="deposit_zero_cash_amount"),
+    pytest.param(TransactionType.CASH_DEPOSIT, Decimal("-100"), id="deposit_negative_cash_amount"),
+    pytest.param(TransactionType.CASH_WITHDRAW, Decimal("-100"), id="withdraw_negative_cash_amount"),
+]
 
-    def test_cash_deposit_missing_cash_amount_raises(
-        self, transaction_service, account_for_transactions
-    ):
-        # Build manually so cash_amount stays None (helper would default it)
-        txn = TransactionCreate(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.CASH_DEPOSIT,
-            txn_time_est=datetime(2025, 1, 15, 12, 0, 0),
-            symbol=None,
-            quantity=None,
-            price=None,
-            cash_amount=None,
-            fees=Decimal("0"),
-            note=None,
-            txn_id=None,
-        )
-        with pytest.raises(ValidationError) as exc_info:
-            transaction_service.create_transaction(txn)
-        assert "cash" in exc_info.value.message.lower()
+_VALID_CASH_CASES = [
+    pytest.param(TransactionType.CASH_DEPOSIT, "5000.00", id="deposit"),
+    pytest.param(TransactionType.CASH_WITHDRAW, "1000.00", id="withdraw"),
+]
 
-    def test_cash_deposit_zero_cash_amount_raises(
-        self, transaction_service, account_for_transactions
-    ):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.CASH_DEPOSIT,
-            cash_amount=Decimal("0"),
-            symbol=None,
-            quantity=None,
-            price=None,
-        )
-        with pytest.raises(ValidationError):
-            transaction_service.create_transaction(txn)
 
-    def test_cash_deposit_negative_cash_amount_raises(
-        self, transaction_service, account_for_transactions
-    ):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.CASH_DEPOSIT,
-            cash_amount=Decimal("-100"),
-            symbol=None,
-            quantity=None,
-            price=None,
-        )
-        with pytest.raises(ValidationError):
-            transaction_service.create_transaction(txn)
+class TestValidateTransactionCreateCash:
+    """Validation for CASH_DEPOSIT and CASH_WITHDRAW: cash_amount > 0."""
 
-    def test_cash_deposit_valid_succeeds(
-        self, transaction_service, account_for_transactions
+    @pytest.mark.parametrize("txn_type, cash_amount", _INVALID_CASH_CASES)
+    def test_invalid_cash_amount_raises(
+        self, transaction_service, account_for_transactions, txn_type, cash_amount
     ):
-        txn = make_transaction_create(
-            account_name=account_for_transactions,
-            txn_type=TransactionType.CASH_DEPOSIT,
-            cash_amount=Decimal("5000.00"),
-            symbol=None,
-            quantity=None,
-            price=None,
-            txn_id="dep-1",
+        # replace() so a None cash_amount survives (the helper would default it)
+        txn = replace(
+            make_transaction_create(account_name=account_for_transactions, txn_type=txn_type, symbol=None),
+            cash_amount=cash_amount,
         )
-        transaction_service.create_transaction(txn)
-        out = transaction_service.get_transaction("dep-1")
-        assert out["txn_type"] == "CASH_DEPOSIT"
-        assert float(out["cash_amount"]) == 5000.0
+        with pytest.raises(ValidationError, match=r"(?i)cash"):
+            transaction_service.create_transaction(txn)
 
-    def test_cash_withdraw_valid_succeeds(
-        self, transaction_service, account_for_transactions
-    ):
+    @pytest.mark.parametrize("txn_type, cash_amount", _VALID_CASH_CASES)
+    def test_valid_succeeds(self, transaction_service, account_for_transactions, txn_type, cash_amount):
         txn = make_transaction_create(
             account_name=account_for_transactions,
-            txn_type=TransactionType.CASH_WITHDRAW,
-            cash_amount=Decimal("1000.00"),
+            txn_type=txn_type,
+            cash_amount=cash_amount,
             symbol=None,
             quantity=None,
             price=None,
-            txn_id="with-1",
+            txn_id="cash-1",
         )
         transaction_service.create_transaction(txn)
-        out = transaction_service.get_transaction("with-1")
-        assert out["txn_type"] == "CASH_WITHDRAW"
-        assert float(out["cash_amount"]) == 1000.0
+        out = transaction_service.get_transaction("cash-1")
+        assert out["txn_type"] == txn_type.value
+        assert float(out["cash_amount"]) == float(cash_amount)
 
 
 # -----------------------------------------------------------------------------
@@ -265,15 +177,14 @@ class TestValidateTransactionCreateTime:
         txn = make_transaction_create(
             account_name=account_for_transactions,
             txn_type=TransactionType.CASH_DEPOSIT,
-            cash_amount=Decimal("100"),
+            cash_amount=100,
             symbol=None,
             quantity=None,
             price=None,
         )
         txn.txn_time_est = None
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?i)txn_time_est|required"):
             transaction_service.create_transaction(txn)
-        assert "txn_time_est" in exc_info.value.message.lower() or "required" in exc_info.value.message.lower()
 
 
 # -----------------------------------------------------------------------------
@@ -292,15 +203,10 @@ class TestCreateTransactionAutoId:
             txn_id=None,
         )
         transaction_service.create_transaction(txn)
-        # Should be persisted with a generated id; we can list or check DB
-        import sqlite3
-        conn = sqlite3.connect(transaction_service._transaction_db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT txn_id FROM transactions")
-        rows = cur.fetchall()
-        conn.close()
+        # Should be persisted with a generated id
+        rows = transaction_service.list_transactions(None)
         assert len(rows) == 1
-        assert len(rows[0][0]) == 32  # uuid4 hex
+        assert len(rows[0]["txn_id"]) == 32  # uuid4 hex
 
     def test_create_with_txn_id_uses_it(
         self, transaction_service, account_for_transactions
@@ -324,12 +230,7 @@ class TestCreateBatchTransaction:
 
     def test_create_batch_empty_list(self, transaction_service, account_for_transactions):
         transaction_service.create_batch_transaction([])
-        import sqlite3
-        conn = sqlite3.connect(transaction_service._transaction_db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT COUNT(*) FROM transactions")
-        assert cur.fetchone()[0] == 0
-        conn.close()
+        assert transaction_service.list_transactions(None) == []
 
     def test_create_batch_multiple_success(
         self, transaction_service, account_for_transactions
@@ -343,7 +244,7 @@ class TestCreateBatchTransaction:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.CASH_DEPOSIT,
-                cash_amount=Decimal("200"),
+                cash_amount=200,
                 symbol=None,
                 quantity=None,
                 price=None,
@@ -366,21 +267,59 @@ class TestCreateBatchTransaction:
             make_transaction_create(
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
-                quantity=Decimal("-1"),
+                quantity=-1,
                 txn_id="batch-bad",
             ),
         ]
         with pytest.raises(ValidationError):
             transaction_service.create_batch_transaction(txns)
-        # First may be committed (current impl validates then saves each)
-        # So batch-ok might exist
-        import sqlite3
-        conn = sqlite3.connect(transaction_service._transaction_db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT COUNT(*) FROM transactions")
-        n = cur.fetchone()[0]
-        conn.close()
-        assert n in (0, 1)
+        # Whole batch is validated before the single insert, so nothing is saved
+        assert transaction_service.list_transactions(None) == []
+
+    def test_create_batch_sell_counts_earlier_buy_in_batch(
+        self, transaction_service_with_validation, account_for_transactions
+    ):
+        txns = [
+            make_transaction_create(
+                account_name=account_for_transactions,
+                txn_type=TransactionType.BUY,
+                symbol="AAPL",
+                quantity=10,
+                txn_id="batch-buy",
+            ),
+            make_transaction_create(
+                account_name=account_for_transactions,
+                txn_type=TransactionType.SELL,
+                symbol="aapl",
+                quantity=4,
+                txn_id="batch-sell",
+            ),
+        ]
+        transaction_service_with_validation.create_batch_transaction(txns)
+        assert transaction_service_with_validation.get_transaction("batch-sell")["quantity"] == 4.0
+
+    def test_create_batch_sell_beyond_batch_buys_raises(
+        self, transaction_service_with_validation, account_for_transactions
+    ):
+        txns = [
+            make_transaction_create(
+                account_name=account_for_transactions,
+                txn_type=TransactionType.BUY,
+                symbol="AAPL",
+                quantity=3,
+                txn_id="batch-buy",
+            ),
+            make_transaction_create(
+                account_name=account_for_transactions,
+                txn_type=TransactionType.SELL,
+                symbol="AAPL",
+                quantity=5,
+                txn_id="batch-sell",
+            ),
+        ]
+        with pytest.raises(ValidationError):
+            transaction_service_with_validation.create_batch_transaction(txns)
+        assert transaction_service_with_validation.count_transactions() == 0
 
 
 # -----------------------------------------------------------------------------
@@ -405,10 +344,8 @@ class TestGetTransaction:
         assert out["txn_type"] == "BUY"
 
     def test_get_transaction_not_found_raises(self, transaction_service):
-        with pytest.raises(NotFoundError) as exc_info:
+        with pytest.raises(NotFoundError, match=r"Transaction not found: no-such-id"):
             transaction_service.get_transaction("no-such-id")
-        assert "Transaction" in exc_info.value.message
-        assert "no-such-id" in exc_info.value.message
 
 
 # -----------------------------------------------------------------------------
@@ -445,9 +382,9 @@ class TestListTransactions:
         assert txn_ids == {"list-1", "list-2"}
 
     def test_list_transactions_filter_by_single_account(
-        self, transaction_service, account_service, account_for_transactions
+        self, transaction_service, make_account, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="OtherBroker"))
+        make_account("OtherBroker")
         transaction_service.create_transaction(
             make_transaction_create(
                 account_name=account_for_transactions,
@@ -468,11 +405,9 @@ class TestListTransactions:
         assert rows[0]["account_name"] == account_for_transactions
 
     def test_list_transactions_filter_by_list_of_accounts(
-        self, transaction_service, account_service, account_for_transactions
+        self, transaction_service, make_account, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="BrokerA"))
-        account_service.save_account(AccountCreate(name="BrokerB"))
-        account_service.save_account(AccountCreate(name="BrokerC"))
+        make_account("BrokerA", "BrokerB", "BrokerC")
         transaction_service.create_transaction(
             make_transaction_create(
                 account_name=account_for_transactions,
@@ -517,6 +452,25 @@ class TestListTransactions:
         assert len(rows) == 1
         assert rows[0]["txn_id"] == "only-one"
 
+    def test_net_quantities_by_account(self, transaction_service, make_account, account_for_transactions):
+        make_account("OtherBroker")
+        transaction_service.create_batch_transaction([
+            make_transaction_create(account_name=account_for_transactions, quantity=10, txn_id="nq-b1"),
+            make_transaction_create(
+                account_name=account_for_transactions, txn_type=TransactionType.SELL, quantity=4, txn_id="nq-s1"
+            ),
+            make_transaction_create(account_name="OtherBroker", quantity=3, txn_id="nq-b2"),
+            make_transaction_create(account_name="OtherBroker", symbol="MSFT", quantity=7, txn_id="nq-m1"),
+        ])
+        assert transaction_service.net_quantities_by_account(" aapl ") == {
+            account_for_transactions: 6.0,
+            "OtherBroker": 3.0,
+        }
+        assert transaction_service.net_quantities_by_account("AAPL", account_names=["OtherBroker"]) == {
+            "OtherBroker": 3.0
+        }
+        assert transaction_service.net_quantities_by_account("GOOG") == {}
+
     def test_list_transactions_returns_dicts_same_shape_as_get_transaction(
         self, transaction_service, account_for_transactions
     ):
@@ -572,9 +526,8 @@ class TestRowToTransactionCreate:
             "fees": 0,
             "note": None,
         }
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?i)txn_time_est|required"):
             transaction_service._row_to_transaction_create(row)
-        assert "txn_time_est" in exc_info.value.message.lower() or "required" in exc_info.value.message.lower()
 
 
 # -----------------------------------------------------------------------------
@@ -607,8 +560,8 @@ class TestEditTransaction:
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="AAPL",
-            quantity=Decimal("10"),
-            price=Decimal("150"),
+            quantity=10,
+            price=150,
             txn_id="edit-fields",
         )
         transaction_service.create_transaction(txn)
@@ -640,9 +593,9 @@ class TestEditTransaction:
         assert edited["symbol"] == "MSFT"
 
     def test_edit_transaction_change_account(
-        self, transaction_service, account_service, account_for_transactions
+        self, transaction_service, make_account, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="OtherBroker"))
+        make_account("OtherBroker")
         txn = make_transaction_create(
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
@@ -736,14 +689,12 @@ class TestTransactionSymbolValidation:
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="INVALIDXYZ",
-            quantity=Decimal("10"),
-            price=Decimal("100"),
+            quantity=10,
+            price=100,
             txn_id="buy-invalid",
         )
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?i:invalid|unknown).*INVALIDXYZ"):
             transaction_service_with_validation.create_transaction(txn)
-        assert "invalid" in exc_info.value.message.lower() or "unknown" in exc_info.value.message.lower()
-        assert "INVALIDXYZ" in exc_info.value.message
 
     def test_buy_valid_symbol_succeeds(
         self, transaction_service_with_validation, account_for_transactions
@@ -753,8 +704,8 @@ class TestTransactionSymbolValidation:
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="AAPL",
-            quantity=Decimal("10"),
-            price=Decimal("100"),
+            quantity=10,
+            price=100,
             txn_id="buy-valid",
         )
         transaction_service_with_validation.create_transaction(txn)
@@ -768,13 +719,12 @@ class TestTransactionSymbolValidation:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="BADTICKER",
-            quantity=Decimal("5"),
-            price=Decimal("50"),
+            quantity=5,
+            price=50,
             txn_id="sell-invalid",
         )
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?i)invalid|unknown"):
             transaction_service_with_validation.create_transaction(txn)
-        assert "invalid" in exc_info.value.message.lower() or "unknown" in exc_info.value.message.lower()
 
 
 # -----------------------------------------------------------------------------
@@ -792,16 +742,12 @@ class TestTransactionSellValidation:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="AAPL",
-            quantity=Decimal("5"),
-            price=Decimal("100"),
+            quantity=5,
+            price=100,
             txn_id="sell-nopos",
         )
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=rf"(?i:hold) AAPL in account {re.escape(account_for_transactions)}"):
             transaction_service_with_validation.create_transaction(txn)
-        msg = exc_info.value.message.lower()
-        assert ("do not hold" in msg or "insufficient" in msg or "hold" in msg)
-        assert "AAPL" in exc_info.value.message
-        assert account_for_transactions in exc_info.value.message
 
     def test_sell_insufficient_quantity_raises(
         self, transaction_service_with_validation, account_for_transactions
@@ -813,8 +759,8 @@ class TestTransactionSellValidation:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="MSFT",
-                quantity=Decimal("3"),
-                price=Decimal("200"),
+                quantity=3,
+                price=200,
                 txn_id="buy-msft",
             )
         )
@@ -822,15 +768,57 @@ class TestTransactionSellValidation:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="MSFT",
-            quantity=Decimal("5"),
-            price=Decimal("210"),
+            quantity=5,
+            price=210,
             txn_id="sell-toomuch",
         )
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=r"(?i:insufficient|hold).*[35]"):
             transaction_service_with_validation.create_transaction(txn)
-        msg = exc_info.value.message.lower()
-        assert "insufficient" in msg or "hold" in msg
-        assert "3" in exc_info.value.message or "5" in exc_info.value.message
+
+    def test_sell_exact_quantity_after_many_fractional_rows_succeeds(
+        self, transaction_service_with_validation, account_for_transactions
+    ):
+        """Held quantity is summed as floats in SQL; after rounding, 30 x 0.1 bought less 10 x 0.1 sold is exactly 2."""
+        svc = transaction_service_with_validation
+        svc.create_batch_transaction(
+            [
+                make_transaction_create(
+                    account_name=account_for_transactions, symbol="AAPL", quantity="0.1", txn_id=f"frac-b{i}"
+                )
+                for i in range(30)
+            ]
+            + [
+                make_transaction_create(
+                    account_name=account_for_transactions,
+                    txn_type=TransactionType.SELL,
+                    symbol="AAPL",
+                    quantity="0.1",
+                    txn_id=f"frac-s{i}",
+                )
+                for i in range(10)
+            ]
+        )
+        assert svc._get_quantity_held(account_for_transactions, "AAPL") == Decimal("2")
+        svc.create_transaction(
+            make_transaction_create(
+                account_name=account_for_transactions,
+                txn_type=TransactionType.SELL,
+                symbol="AAPL",
+                quantity="2",
+                txn_id="frac-sell-all",
+            )
+        )
+        assert svc._get_quantity_held(account_for_transactions, "AAPL") == 0
+        with pytest.raises(ValidationError, match=r"(?i:insufficient|hold)"):
+            svc.create_transaction(
+                make_transaction_create(
+                    account_name=account_for_transactions,
+                    txn_type=TransactionType.SELL,
+                    symbol="AAPL",
+                    quantity="0.0001",
+                    txn_id="frac-oversell",
+                )
+            )
 
     def test_sell_exact_quantity_succeeds(
         self, transaction_service_with_validation, account_for_transactions
@@ -840,8 +828,8 @@ class TestTransactionSellValidation:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="GOOG",
-                quantity=Decimal("10"),
-                price=Decimal("140"),
+                quantity=10,
+                price=140,
                 txn_id="buy-goog",
             )
         )
@@ -849,8 +837,8 @@ class TestTransactionSellValidation:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="GOOG",
-            quantity=Decimal("10"),
-            price=Decimal("150"),
+            quantity=10,
+            price=150,
             txn_id="sell-exact",
         )
         transaction_service_with_validation.create_transaction(txn)
@@ -865,8 +853,8 @@ class TestTransactionSellValidation:
                 account_name=account_for_transactions,
                 txn_type=TransactionType.BUY,
                 symbol="NVDA",
-                quantity=Decimal("20"),
-                price=Decimal("500"),
+                quantity=20,
+                price=500,
                 txn_id="buy-nvda",
             )
         )
@@ -874,8 +862,8 @@ class TestTransactionSellValidation:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="NVDA",
-            quantity=Decimal("7"),
-            price=Decimal("600"),
+            quantity=7,
+            price=600,
             txn_id="sell-partial",
         )
         transaction_service_with_validation.create_transaction(txn)
@@ -897,8 +885,8 @@ class TestTransactionCashDestination:
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="AAPL",
-            quantity=Decimal("10"),
-            price=Decimal("100"),
+            quantity=10,
+            price=100,
             txn_id="b-cd",
         )
         transaction_service.create_transaction(txn)
@@ -906,8 +894,8 @@ class TestTransactionCashDestination:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="AAPL",
-            quantity=Decimal("5"),
-            price=Decimal("110"),
+            quantity=5,
+            price=110,
             txn_id="s-cd",
             cash_destination_account=None,
         )
@@ -916,15 +904,15 @@ class TestTransactionCashDestination:
         assert row.get("cash_destination_account") == account_for_transactions
 
     def test_sell_with_cash_destination_stored(
-        self, transaction_service, account_service, account_for_transactions
+        self, transaction_service, make_account, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="Savings"))
+        make_account("Savings")
         txn_buy = make_transaction_create(
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="TSLA",
-            quantity=Decimal("5"),
-            price=Decimal("250"),
+            quantity=5,
+            price=250,
             txn_id="b-cd2",
         )
         transaction_service.create_transaction(txn_buy)
@@ -932,8 +920,8 @@ class TestTransactionCashDestination:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="TSLA",
-            quantity=Decimal("2"),
-            price=Decimal("260"),
+            quantity=2,
+            price=260,
             txn_id="s-cd2",
             cash_destination_account="Savings",
         )
@@ -948,8 +936,8 @@ class TestTransactionCashDestination:
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="META",
-            quantity=Decimal("5"),
-            price=Decimal("300"),
+            quantity=5,
+            price=300,
             txn_id="b-cd3",
         )
         transaction_service.create_transaction(txn_buy)
@@ -957,26 +945,24 @@ class TestTransactionCashDestination:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="META",
-            quantity=Decimal("1"),
-            price=Decimal("310"),
+            quantity=1,
+            price=310,
             txn_id="s-cd3",
             cash_destination_account="NonExistentAccount",
         )
-        with pytest.raises(NotFoundError) as exc_info:
+        with pytest.raises(NotFoundError, match=r"Account not found: NonExistentAccount"):
             transaction_service.create_transaction(txn_sell)
-        assert "Account" in exc_info.value.message or "not found" in exc_info.value.message
-        assert "NonExistentAccount" in exc_info.value.message
 
     def test_edit_sell_cash_destination(
-        self, transaction_service, account_service, account_for_transactions
+        self, transaction_service, make_account, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="Other"))
+        make_account("Other")
         txn_buy = make_transaction_create(
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="AMZN",
-            quantity=Decimal("4"),
-            price=Decimal("180"),
+            quantity=4,
+            price=180,
             txn_id="b-edit-cd",
         )
         transaction_service.create_transaction(txn_buy)
@@ -984,8 +970,8 @@ class TestTransactionCashDestination:
             account_name=account_for_transactions,
             txn_type=TransactionType.SELL,
             symbol="AMZN",
-            quantity=Decimal("2"),
-            price=Decimal("190"),
+            quantity=2,
+            price=190,
             txn_id="s-edit-cd",
             cash_destination_account=account_for_transactions,
         )
@@ -1016,9 +1002,9 @@ class TestCountTransactions:
         assert transaction_service.count_transactions() == 2
 
     def test_count_filtered_by_account(
-        self, transaction_service, account_service, account_for_transactions
+        self, transaction_service, make_account, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="OtherBroker"))
+        make_account("OtherBroker")
         transaction_service.create_transaction(
             make_transaction_create(account_name=account_for_transactions, txn_id="cnt-a1")
         )
@@ -1045,9 +1031,9 @@ class TestCountTransactionsByAccount:
         assert transaction_service.count_transactions_by_account() == {}
 
     def test_multiple_accounts(
-        self, transaction_service, account_service, account_for_transactions
+        self, transaction_service, make_account, account_for_transactions
     ):
-        account_service.save_account(AccountCreate(name="BrokerX"))
+        make_account("BrokerX")
         transaction_service.create_transaction(
             make_transaction_create(account_name=account_for_transactions, txn_id="cba-1")
         )
@@ -1077,8 +1063,8 @@ class TestEditTransactionSafety:
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="AAPL",
-            quantity=Decimal("10"),
-            price=Decimal("100"),
+            quantity=10,
+            price=100,
             txn_id="edit-safe",
         )
         transaction_service.create_transaction(txn)
@@ -1100,8 +1086,8 @@ class TestEditTransactionSafety:
             account_name=account_for_transactions,
             txn_type=TransactionType.BUY,
             symbol="MSFT",
-            quantity=Decimal("5"),
-            price=Decimal("200"),
+            quantity=5,
+            price=200,
             txn_id="edit-safe-acc",
         )
         transaction_service.create_transaction(txn)